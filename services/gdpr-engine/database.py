@@ -1,9 +1,122 @@
 import asyncpg
+import orjson
 import os
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Set, Tuple
 from models.user import User
-from models.creditor import Creditor
-from models.gdpr import GDPRRequest, GDPRResponse, Violation
+from models.creditor import Creditor, CreditorRow
+from models.gdpr import GDPRRequest, GDPRResponse, Violation, ViolationRow
+
+# Per-creditor queries. Fixed SQL text so asyncpg's per-connection statement
+# cache prepares each one once and reuses the plan on every call.
+CREDITOR_VIOLATIONS_SQL = """
+    SELECT id, gdpr_request_id, creditor_id, type, severity, status, confidence,
+           evidence, legal_reference, estimated_damage, blockchain_hash, created_at
+    FROM violations
+    WHERE creditor_id = $1
+      AND ($2::text IS NULL OR severity = $2)
+      AND ($3::text IS NULL OR type = $3)
+    ORDER BY created_at DESC
+    LIMIT $4 OFFSET $5
+"""
+
+CREDITOR_GDPR_REQUESTS_SQL = """
+    SELECT id, user_id, creditor_id, reference_id, status, sent_at, response_due,
+           response_received_at, created_at, updated_at
+    FROM gdpr_requests
+    WHERE creditor_id = $1
+    ORDER BY created_at DESC
+"""
+
+CREDITOR_SETTLEMENTS_SQL = """
+    SELECT s.id, s.user_id, s.debt_id, d.creditor_id, s.original_amount, s.settled_amount,
+           s.saved_amount, s.status, s.proposed_at, s.completed_at
+    FROM settlements s
+    JOIN debts d ON d.id = s.debt_id
+    WHERE d.creditor_id = $1
+    ORDER BY s.proposed_at DESC
+"""
+
+# SWORD gate: threshold check and total in one aggregate (served by the creditor_id-leading index)
+SWORD_THRESHOLD_SQL = """
+    SELECT count(*) >= $2 AS met, count(*) AS total
+    FROM violations
+    WHERE creditor_id = $1
+"""
+
+# Columns written for each detected violation; inserted in one pipelined executemany
+CREATE_VIOLATIONS_SQL = """
+    INSERT INTO violations (id, gdpr_request_id, creditor_id, type, severity, confidence,
+                            evidence, legal_reference, estimated_damage, status, created_at)
+    VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11)
+"""
+
+VIOLATION_INSERT_COLUMNS = (
+    "id", "gdpr_request_id", "creditor_id", "type", "severity", "confidence",
+    "evidence", "legal_reference", "estimated_damage", "status", "created_at"
+)
+
+# Bulk leaderboard inputs for active creditors, optionally one industry (creditor type).
+# Related rows are fetched flat and bucketed by creditor_id in Python.
+LEADERBOARD_CREDITORS_SQL = """
+    SELECT id, name, organization_number AS org_number, type
+    FROM creditors
+    WHERE is_active AND ($1::text IS NULL OR lower(type) = lower($1))
+"""
+
+LEADERBOARD_VIOLATIONS_SQL = """
+    SELECT v.id, v.gdpr_request_id, v.creditor_id, v.type, v.severity, v.status, v.confidence,
+           v.evidence, v.legal_reference, v.estimated_damage, v.blockchain_hash, v.created_at
+    FROM violations v
+    JOIN creditors c ON c.id = v.creditor_id
+    WHERE c.is_active AND ($1::text IS NULL OR lower(c.type) = lower($1))
+    ORDER BY v.created_at DESC
+"""
+
+LEADERBOARD_GDPR_REQUESTS_SQL = """
+    SELECT r.id, r.user_id, r.creditor_id, r.reference_id, r.status, r.sent_at, r.response_due,
+           r.response_received_at, r.created_at, r.updated_at
+    FROM gdpr_requests r
+    JOIN creditors c ON c.id = r.creditor_id
+    WHERE c.is_active AND ($1::text IS NULL OR lower(c.type) = lower($1))
+    ORDER BY r.created_at DESC
+"""
+
+LEADERBOARD_SETTLEMENTS_SQL = """
+    SELECT s.id, s.user_id, s.debt_id, d.creditor_id, s.original_amount, s.settled_amount,
+           s.saved_amount, s.status, s.proposed_at, s.completed_at
+    FROM settlements s
+    JOIN debts d ON d.id = s.debt_id
+    JOIN creditors c ON c.id = d.creditor_id
+    WHERE c.is_active AND ($1::text IS NULL OR lower(c.type) = lower($1))
+    ORDER BY s.proposed_at DESC
+"""
+
+ACTIVE_CREDITOR_IDS_SQL = """
+    SELECT id
+    FROM creditors
+    WHERE is_active AND ($1::text IS NULL OR lower(type) = lower($1))
+"""
+
+# Materialised transparency reports, one row per creditor (shared by API and worker)
+UPSERT_COMPLIANCE_SNAPSHOT_SQL = """
+    INSERT INTO creditor_compliance_snapshot (creditor_id, creditor_type, grade, reputation_score,
+                                              violation_count, report_json, updated_at)
+    VALUES ($1, $2, $3, $4, $5, $6::jsonb, $7)
+    ON CONFLICT (creditor_id) DO UPDATE
+    SET creditor_type = EXCLUDED.creditor_type,
+        grade = EXCLUDED.grade,
+        reputation_score = EXCLUDED.reputation_score,
+        violation_count = EXCLUDED.violation_count,
+        report_json = EXCLUDED.report_json,
+        updated_at = EXCLUDED.updated_at
+"""
+
+COMPLIANCE_SNAPSHOTS_SQL = """
+    SELECT creditor_id, creditor_type, grade, reputation_score, violation_count,
+           report_json, updated_at
+    FROM creditor_compliance_snapshot
+    WHERE $1::text IS NULL OR creditor_type = upper($1)
+"""
 
 class DictObj:
     """Simple object wrapper for dictionaries to allow attribute access"""
@@ -18,13 +131,39 @@ class Database:
         # In-memory storage for development (until real DB is connected)
         self._gdpr_requests = {}  # key: request_id, value: request_data
         self._gdpr_by_user = {}    # key: user_id, value: list of request_ids
+        self._compliance_snapshots = {}  # key: creditor_id, value: snapshot row
+        self._violations = []  # violation rows stored before the real DB is connected
         
     async def connect(self):
+        if self.database_url.startswith(("postgres://", "postgresql://")):
+            # Shared pool; statement_cache_size keeps prepared per-creditor queries hot
+            try:
+                self.pool = await asyncpg.create_pool(
+                    self.database_url,
+                    min_size=4,
+                    max_size=32,
+                    statement_cache_size=1024
+                )
+                print("Database connected (PostgreSQL pool)")
+                return
+
+            except Exception as e:
+                # DATABASE_POOL_REQUIRED=1 makes an unreachable database fatal (production);
+                # otherwise fall back to user-service HTTP lookups and in-memory storage
+                if os.getenv("DATABASE_POOL_REQUIRED") == "1":
+                    raise
+                print(f"PostgreSQL unavailable ({e}), falling back to mock database")
+
         # Mock database connection for development
-        # In production, this would connect to the actual database
         print("Database connected (mock)")
         
     async def disconnect(self):
+        if self.pool is not None:
+            await self.pool.close()
+            self.pool = None
+            print("Database disconnected (PostgreSQL pool)")
+            return
+
         # Mock database disconnection
         print("Database disconnected (mock)")
         
@@ -73,7 +212,8 @@ class Database:
                     created_at = datetime.fromisoformat(user_data['createdAt'].replace('Z', '+00:00'))
                     updated_at = datetime.fromisoformat(user_data['updatedAt'].replace('Z', '+00:00'))
 
-                    return User(
+                    # Trusted service data, already converted above: skip validation
+                    return User.model_construct(
                         id=user_data['id'],
                         email=user_data['email'],
                         name=user_data.get('name'),
@@ -129,7 +269,8 @@ class Database:
                     created_at = datetime.fromisoformat(creditor_data['createdAt'].replace('Z', '+00:00'))
                     updated_at = datetime.fromisoformat(creditor_data['updatedAt'].replace('Z', '+00:00'))
 
-                    return Creditor(
+                    # Trusted service data, already converted above: skip validation
+                    return Creditor.model_construct(
                         id=creditor_data['id'],
                         name=creditor_data['name'],
                         organization_number=creditor_data.get('organizationNumber'),
@@ -316,6 +457,21 @@ class Database:
             "average_response_time": 25.5
         }
 
+    async def check_sword_threshold(self, creditor_id: str, threshold: int) -> Tuple[bool, int]:
+        """Check whether a creditor has reached the SWORD violation threshold.
+
+        Returns (threshold_met, total_violations) so callers can reject early
+        without building the full stats payload.
+        """
+        if self.pool is not None:
+            async with self.pool.acquire() as conn:
+                row = await conn.fetchrow(SWORD_THRESHOLD_SQL, creditor_id, threshold)
+            return row["met"], row["total"]
+
+        # Mock threshold check (mirrors get_creditor_violation_stats)
+        total_violations = 125
+        return total_violations >= threshold, total_violations
+
     async def get_user_debt_with_creditor(self, user_id: str, creditor_id: str) -> Optional[Dict[str, Any]]:
         # Mock debt retrieval for GDPR request generation
         from datetime import datetime
@@ -393,6 +549,76 @@ class Database:
         print(f"Warning: GDPR request {request_id} not found in memory")
         return False
 
+    async def submit_gdpr_response_tx(
+        self,
+        gdpr_request_id: str,
+        creditor_id: str,
+        response_data: Dict[str, Any]
+    ) -> bool:
+        """Store a creditor's GDPR response and mark the request RESPONDED in one transaction"""
+        import os
+        import aiohttp
+        import logging
+
+        try:
+            user_service_url = os.getenv('USER_SERVICE_URL', 'http://localhost:3001')
+            service_api_key = os.getenv('SERVICE_API_KEY', 'dev-service-key-12345')
+
+            url = f"{user_service_url}/api/internal/gdpr-requests/{gdpr_request_id}/creditor-response"
+            headers = {'x-service-api-key': service_api_key}
+            payload = {
+                'creditor_id': creditor_id,
+                'response': response_data
+            }
+
+            async with aiohttp.ClientSession() as session:
+                async with session.post(url, headers=headers, json=payload) as response:
+                    if response.status != 200:
+                        logging.error(f"Error storing GDPR response for {gdpr_request_id}: HTTP {response.status}")
+                        return False
+
+                    return True
+
+        except Exception as e:
+            logging.error(f"Error storing GDPR response for {gdpr_request_id}: {e}")
+            return False
+
+    async def submit_settlement_response_tx(
+        self,
+        settlement_id: str,
+        creditor_id: str,
+        response_data: Dict[str, Any]
+    ) -> bool:
+        """Store a creditor's settlement decision (status, counter-offer, notes) in one update"""
+        import os
+        import aiohttp
+        import logging
+
+        try:
+            user_service_url = os.getenv('USER_SERVICE_URL', 'http://localhost:3001')
+            service_api_key = os.getenv('SERVICE_API_KEY', 'dev-service-key-12345')
+
+            url = f"{user_service_url}/api/internal/settlements/{settlement_id}/creditor-response"
+            headers = {'x-service-api-key': service_api_key}
+            payload = {
+                'creditor_id': creditor_id,
+                'action': response_data.get('action'),
+                'counter_offer_amount': response_data.get('counter_offer_amount'),
+                'notes': response_data.get('notes')
+            }
+
+            async with aiohttp.ClientSession() as session:
+                async with session.post(url, headers=headers, json=payload) as response:
+                    if response.status != 200:
+                        logging.error(f"Error storing settlement response for {settlement_id}: HTTP {response.status}")
+                        return False
+
+                    return True
+
+        except Exception as e:
+            logging.error(f"Error storing settlement response for {settlement_id}: {e}")
+            return False
+
     async def get_last_gdpr_request_for_creditor(
         self,
         user_id: str,
@@ -433,10 +659,11 @@ class Database:
                     if not request_data:
                         return None
 
-                    # Convert timestamp strings
+                    # Convert timestamp strings (epoch seconds kept for cheap cooldown math)
                     created_at_str = request_data.get('createdAt')
                     if created_at_str:
                         request_data['created_at'] = datetime.fromisoformat(created_at_str.replace('Z', '+00:00'))
+                        request_data['created_at_epoch'] = request_data['created_at'].timestamp()
 
                     return request_data
 
@@ -474,6 +701,266 @@ class Database:
             logging.error(f"Error fetching debt {debt_id}: {e}")
             return None
 
+    async def get_leaderboard_dataset(self, industry: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Fetch creditors and all report inputs in bulk.
+
+        Reads through the PostgreSQL pool when connected, otherwise in one
+        round-trip from user-service. Returns one entry per creditor shaped
+        {creditor, violations, gdpr_requests, datatilsynet_complaints, settlements},
+        replacing the per-creditor N+1 lookups used by the transparency endpoints.
+        Rows stay raw dicts (CreditorRow / ViolationRow); no model validation
+        is run on this bulk path.
+        """
+        import os
+        import aiohttp
+        import logging
+        from collections import defaultdict
+
+        try:
+            if self.pool is not None:
+                async with self.pool.acquire() as conn:
+                    data = {
+                        'creditors': [dict(row) for row in await conn.fetch(LEADERBOARD_CREDITORS_SQL, industry)],
+                        'violations': [dict(row) for row in await conn.fetch(LEADERBOARD_VIOLATIONS_SQL, industry)],
+                        'gdprRequests': [dict(row) for row in await conn.fetch(LEADERBOARD_GDPR_REQUESTS_SQL, industry)],
+                        'settlements': [dict(row) for row in await conn.fetch(LEADERBOARD_SETTLEMENTS_SQL, industry)]
+                    }
+
+            else:
+                user_service_url = os.getenv('USER_SERVICE_URL', 'http://localhost:3001')
+                service_api_key = os.getenv('SERVICE_API_KEY', 'dev-service-key-12345')
+
+                url = f"{user_service_url}/api/internal/transparency/dataset"
+                headers = {'x-service-api-key': service_api_key}
+                params = {}
+
+                if industry:
+                    params['industry'] = industry
+
+                async with aiohttp.ClientSession() as session:
+                    async with session.get(url, headers=headers, params=params) as response:
+                        if response.status != 200:
+                            logging.error(f"Error fetching transparency dataset: HTTP {response.status}")
+                            return []
+
+                        data = await response.json()
+
+            # Bucket each relation by creditor_id in a single pass
+            related = {}
+            for key, field in (
+                ('violations', 'violations'),
+                ('gdpr_requests', 'gdprRequests'),
+                ('datatilsynet_complaints', 'datatilsynetComplaints'),
+                ('settlements', 'settlements')
+            ):
+                buckets = defaultdict(list)
+                for row in data.get(field, []):
+                    buckets[row.get('creditor_id')].append(row)
+                related[key] = buckets
+
+            creditors: List[CreditorRow] = data.get('creditors', [])
+            violations: Dict[str, List[ViolationRow]] = related['violations']
+
+            return [
+                {
+                    'creditor': creditor,
+                    'violations': violations.get(creditor.get('id'), []),
+                    'gdpr_requests': related['gdpr_requests'].get(creditor.get('id'), []),
+                    'datatilsynet_complaints': related['datatilsynet_complaints'].get(creditor.get('id'), []),
+                    'settlements': related['settlements'].get(creditor.get('id'), [])
+                }
+                for creditor in creditors
+            ]
+
+        except Exception as e:
+            logging.error(f"Error fetching transparency dataset: {e}")
+            return []
+
+    async def upsert_compliance_snapshot(
+        self,
+        creditor_id: str,
+        creditor_type: str,
+        report: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Store the materialised transparency report for a creditor.
+
+        Upserted into creditor_compliance_snapshot when the PostgreSQL pool is
+        connected; otherwise kept in process memory (mock mode only). The
+        creditor type is stored upper-cased ('inkasso' -> 'INKASSO') so it
+        matches the industry names the transparency endpoints are queried with.
+        """
+        from datetime import datetime
+
+        snapshot = {
+            "creditor_id": creditor_id,
+            "creditor_type": creditor_type.upper(),
+            "grade": report.get("compliance_grade", {}).get("grade"),
+            "reputation_score": report.get("reputation_score"),
+            "violation_count": report.get("metrics", {}).get("violations", {}).get("total_violations", 0),
+            "report_json": report,
+            "updated_at": datetime.now()
+        }
+
+        if self.pool is not None:
+            async with self.pool.acquire() as conn:
+                await conn.execute(
+                    UPSERT_COMPLIANCE_SNAPSHOT_SQL,
+                    snapshot["creditor_id"],
+                    snapshot["creditor_type"],
+                    snapshot["grade"],
+                    snapshot["reputation_score"],
+                    snapshot["violation_count"],
+                    orjson.dumps(report).decode(),
+                    snapshot["updated_at"]
+                )
+            return snapshot
+
+        self._compliance_snapshots[creditor_id] = snapshot
+        return snapshot
+
+    async def create_violations_bulk(self, rows: List[Dict[str, Any]]) -> int:
+        """Insert detected violations in a single round-trip; returns the number stored"""
+        if not rows:
+            return 0
+
+        if self.pool is not None:
+            records = [tuple(row.get(column) for column in VIOLATION_INSERT_COLUMNS) for row in rows]
+            async with self.pool.acquire() as conn:
+                async with conn.transaction():
+                    await conn.executemany(CREATE_VIOLATIONS_SQL, records)
+            return len(rows)
+
+        self._violations.extend(rows)
+        return len(rows)
+
+    async def get_active_creditor_ids(self, industry: Optional[str] = None) -> Optional[Set[str]]:
+        """IDs of active creditors (optionally one industry); None when they cannot be fetched"""
+        import aiohttp
+        import logging
+
+        if self.pool is not None:
+            async with self.pool.acquire() as conn:
+                rows = await conn.fetch(ACTIVE_CREDITOR_IDS_SQL, industry)
+            return {row["id"] for row in rows}
+
+        try:
+            user_service_url = os.getenv('USER_SERVICE_URL', 'http://localhost:3001')
+            service_api_key = os.getenv('SERVICE_API_KEY', 'dev-service-key-12345')
+
+            url = f"{user_service_url}/api/internal/creditors/ids"
+            headers = {'x-service-api-key': service_api_key}
+            params = {}
+
+            if industry:
+                params['industry'] = industry
+
+            async with aiohttp.ClientSession() as session:
+                async with session.get(url, headers=headers, params=params) as response:
+                    if response.status != 200:
+                        logging.error(f"Error fetching active creditor IDs: HTTP {response.status}")
+                        return None
+
+                    data = await response.json()
+                    return set(data.get('ids', []))
+
+        except Exception as e:
+            logging.error(f"Error fetching active creditor IDs: {e}")
+            return None
+
+    async def get_compliance_snapshots(self, industry: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Fetch materialised compliance snapshots, optionally for one industry"""
+        if self.pool is not None:
+            async with self.pool.acquire() as conn:
+                rows = await conn.fetch(COMPLIANCE_SNAPSHOTS_SQL, industry)
+            return [
+                {**dict(row), "report_json": orjson.loads(row["report_json"])}
+                for row in rows
+            ]
+
+        return [
+            snapshot for snapshot in self._compliance_snapshots.values()
+            if industry is None or snapshot["creditor_type"] == industry.upper()
+        ]
+
+    async def get_creditor_violations(
+        self,
+        creditor_id: str,
+        severity: Optional[str] = None,
+        violation_type: Optional[str] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None
+    ) -> List[ViolationRow]:
+        """Fetch violations for a creditor, filtered and paginated server-side"""
+        import os
+        import aiohttp
+        import logging
+
+        if self.pool is not None:
+            async with self.pool.acquire() as conn:
+                rows = await conn.fetch(
+                    CREDITOR_VIOLATIONS_SQL,
+                    creditor_id,
+                    severity,
+                    violation_type,
+                    limit,
+                    offset or 0
+                )
+            return [dict(row) for row in rows]
+
+        try:
+            user_service_url = os.getenv('USER_SERVICE_URL', 'http://localhost:3001')
+            service_api_key = os.getenv('SERVICE_API_KEY', 'dev-service-key-12345')
+
+            url = f"{user_service_url}/api/internal/creditors/{creditor_id}/violations"
+            headers = {'x-service-api-key': service_api_key}
+            params = {}
+
+            if severity:
+                params['severity'] = severity
+            if violation_type:
+                params['type'] = violation_type
+            if limit is not None:
+                params['limit'] = str(limit)
+            if offset is not None:
+                params['offset'] = str(offset)
+
+            async with aiohttp.ClientSession() as session:
+                async with session.get(url, headers=headers, params=params) as response:
+                    if response.status != 200:
+                        logging.error(f"Error fetching violations for creditor {creditor_id}: HTTP {response.status}")
+                        return []
+
+                    data = await response.json()
+                    return data.get('violations', [])
+
+        except Exception as e:
+            logging.error(f"Error fetching violations for creditor {creditor_id}: {e}")
+            return []
+
+    async def get_creditor_gdpr_requests(self, creditor_id: str) -> List[Dict[str, Any]]:
+        """Fetch all GDPR requests sent to a creditor"""
+        if self.pool is None:
+            # Mock creditor GDPR requests retrieval
+            return []
+
+        async with self.pool.acquire() as conn:
+            rows = await conn.fetch(CREDITOR_GDPR_REQUESTS_SQL, creditor_id)
+        return [dict(row) for row in rows]
+
+    async def get_creditor_settlements(self, creditor_id: str) -> List[Dict[str, Any]]:
+        """Fetch all settlements on debts held by a creditor"""
+        if self.pool is None:
+            # Mock creditor settlements retrieval
+            return []
+
+        async with self.pool.acquire() as conn:
+            rows = await conn.fetch(CREDITOR_SETTLEMENTS_SQL, creditor_id)
+        return [dict(row) for row in rows]
+
+    async def get_creditor_datatilsynet_complaints(self, creditor_id: str) -> List[Dict[str, Any]]:
+        # Mock Datatilsynet complaints retrieval (complaints are not persisted yet)
+        return []
+
     async def get_user_violations_for_creditor(
         self,
         user_id: str,
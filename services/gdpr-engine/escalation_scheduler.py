@@ -21,17 +21,21 @@ sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 from database import Database
 from services.gdpr_engine import GDPREngine
-from services.email_service import EmailService
 
 logger = logging.getLogger(__name__)
 
+# Escalations processed concurrently per check (matches the database pool's max_size)
+ESCALATION_CONCURRENCY = 32
+
 class EscalationScheduler:
     """Automated escalation for non-responsive GDPR requests"""
 
     def __init__(self):
         self.db = Database()
-        self.email_service = EmailService()
-        self.gdpr_engine = GDPREngine(self.db, self.email_service)
+        self.gdpr_engine = GDPREngine(self.db)
+
+        # Reminders are queued on the engine's email buffer, so share its service
+        self.email_service = self.gdpr_engine.email_service
 
         # Escalation checkpoints (days after sending)
         self.checkpoints = [25, 35, 45, 60]
@@ -69,7 +73,8 @@ class EscalationScheduler:
                 self.stats['errors'] += 1
                 await asyncio.sleep(600)  # Wait 10 minutes on error
 
-        # Cleanup
+        # Cleanup (flushes queued reminders before closing the engine's clients)
+        await self.gdpr_engine.close()
         await self.db.disconnect()
 
     async def _check_pending_requests(self):
@@ -80,7 +85,7 @@ class EscalationScheduler:
             # Query for all sent requests that haven't received a response
             pending_requests = await self._get_pending_requests()
 
-            escalation_count = 0
+            escalations = []
 
             for request in pending_requests:
                 days_elapsed = self._calculate_days_elapsed(request)
@@ -88,13 +93,35 @@ class EscalationScheduler:
                 # Check if this request needs escalation at any checkpoint
                 if days_elapsed in self.checkpoints:
                     logger.info(f"⚠️  Request {request['id']} has reached Day {days_elapsed} checkpoint")
-                    await self.gdpr_engine._escalate_non_response(request['id'], days_elapsed)
-                    escalation_count += 1
+                    escalations.append((request['id'], days_elapsed))
 
                 # Also check if we're past day 25 but missed the exact checkpoint
                 elif days_elapsed > 25 and days_elapsed < 35:
                     logger.warning(f"⏰ Request {request['id']} is overdue for Day 25 reminder (currently Day {days_elapsed})")
-                    await self.gdpr_engine._escalate_non_response(request['id'], 25)
+                    escalations.append((request['id'], 25))
+
+            # Independent requests escalate concurrently, bounded so a Day-35 burst
+            # doesn't exhaust the database pool
+            semaphore = asyncio.Semaphore(ESCALATION_CONCURRENCY)
+
+            async def escalate(request_id, day):
+                async with semaphore:
+                    await self.gdpr_engine._escalate_non_response(request_id, day)
+
+            results = await asyncio.gather(
+                *(escalate(request_id, day) for request_id, day in escalations),
+                return_exceptions=True
+            )
+
+            # Reminders are fire-and-forget on the email buffer; make sure this check's went out
+            await self.email_service.flush()
+
+            escalation_count = 0
+            for (request_id, day), result in zip(escalations, results):
+                if isinstance(result, Exception):
+                    logger.error(f"Escalation failed for request {request_id} (Day {day}): {result}")
+                    self.stats['errors'] += 1
+                else:
                     escalation_count += 1
 
             self.stats['checks_performed'] += 1
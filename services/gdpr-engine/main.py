@@ -9,17 +9,27 @@ if str(current_dir) not in sys.path:
 
 from fastapi import FastAPI, BackgroundTasks, Depends, HTTPException, Request, status
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse, Response, StreamingResponse
 from pydantic import BaseModel, EmailStr
 from typing import List, Optional, Dict, Any
 from datetime import datetime, timedelta
+from decimal import Decimal
 import asyncio
+import hashlib
+from concurrent.futures import ProcessPoolExecutor
+import time
+from collections import Counter
 import aiohttp
 import asyncpg
+import orjson
 import redis.asyncio as redis
+from arq import create_pool
+from arq.connections import RedisSettings
 from dotenv import load_dotenv
 import logging
 
-from models.gdpr import GDPRRequest, GDPRRequestCreate, GDPRResponse
+from models.gdpr import GDPRRequest, GDPRRequestCreate, GDPRResponse, SwordMintRequest
 from models.creditor import Creditor
 from models.user import User
 from services.gdpr_engine import GDPREngine
@@ -32,6 +42,8 @@ from services.transparency_service import TransparencyService
 from services.sword_service import SWORDService
 from services.creditor_portal_service import CreditorPortalService
 from services.monitoring_service import MonitoringService
+from services.ttl_cache import TTLCache
+from services.compliance_snapshot_service import ComplianceSnapshotService
 from database import Database
 
 load_dotenv()
@@ -43,21 +55,68 @@ logger = logging.getLogger(__name__)
 # GDPR Request Cooldown Configuration
 # Prevents spam by limiting how often users can send requests to the same creditor
 GDPR_REQUEST_COOLDOWN_HOURS = int(os.getenv("GDPR_REQUEST_COOLDOWN_HOURS", "168"))  # Default: 7 days (168 hours)
+GDPR_REQUEST_COOLDOWN = timedelta(hours=GDPR_REQUEST_COOLDOWN_HOURS)
+GDPR_REQUEST_COOLDOWN_SECONDS = GDPR_REQUEST_COOLDOWN_HOURS * 3600
+
+# Durable job queue (arq worker: `arq worker.WorkerSettings`)
+# When REDIS_URL is unset, jobs fall back to in-process BackgroundTasks (local development)
+REDIS_URL = os.getenv("REDIS_URL")
+
+# Minimum number of violations before the SWORD protocol can be triggered manually
+SWORD_VIOLATION_THRESHOLD = 100
+
+# Fields copied into SWORD evidence packages (GDPR request fields as (key, source))
+SWORD_VIOLATION_KEYS = ("id", "type", "severity", "description", "legal_reference", "confidence", "detected_at")
+SWORD_CREDITOR_KEYS = ("id", "name", "org_number", "type")
+SWORD_GDPR_REQUEST_FIELDS = (("id", "id"), ("sent_at", "sent_at"), ("deadline", "response_due"), ("status", "status"))
+
+# Max transaction IDs per blockchain batch verification call
+EVIDENCE_VERIFY_BATCH_SIZE = 50
+
+# Public leaderboard/industry reports are expensive and change slowly: cache them briefly
+TRANSPARENCY_CACHE_TTL_SECONDS = 120
+TRANSPARENCY_CACHE_REFRESH_AHEAD_SECONDS = 20
+TRANSPARENCY_CACHE_MAX_ENTRIES = 16
+
+# Accepted leaderboard categories / industries (these become transparency_cache keys)
+LEADERBOARD_CATEGORIES = ("all", "best", "worst")
+SUPPORTED_INDUSTRIES = ("INKASSO", "BANK", "TELECOM", "OTHER")
+
+# Per-creditor transparency reports are reused across endpoints for a short window
+CREDITOR_REPORT_CACHE_TTL_SECONDS = 30
+CREDITOR_REPORT_CACHE_MAX_ENTRIES = 1024
+
+# Stored compliance snapshots older than this are rebuilt from live data
+COMPLIANCE_SNAPSHOT_MAX_AGE = timedelta(minutes=30)
 
 app = FastAPI(
     title="DAMOCLES GDPR Engine",
     description="Automated GDPR request generation and violation detection",
-    version="1.0.0"
+    version="1.0.0",
+    # orjson serialises the large nested report payloads several times faster than stdlib json
+    default_response_class=ORJSONResponse
 )
 
+# Compress large JSON payloads (transparency reports, settlement analyses).
+# Registered before CORS so CORSMiddleware stays outermost and adds its headers last.
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+
 # CORS middleware - support both local and production
-allowed_origins = os.getenv("ALLOWED_ORIGINS", "").split(",") if os.getenv("ALLOWED_ORIGINS") else [
+# Parsed once at import: entries are stripped/lowercased so "a, b" in .env still
+# matches exactly, and stored as a tuple for the per-request origin check.
+DEFAULT_ALLOWED_ORIGINS = (
     "http://localhost:3000",
     "http://localhost:3001",
     "http://localhost:3002",
     "https://damocles.no",
     "https://www.damocles.no"
-]
+)
+
+allowed_origins = tuple(
+    origin.strip().lower()
+    for origin in os.getenv("ALLOWED_ORIGINS", "").split(",")
+    if origin.strip()
+) or DEFAULT_ALLOWED_ORIGINS
 
 app.add_middleware(
     CORSMiddleware,
@@ -67,9 +126,17 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+@app.exception_handler(Exception)
+async def unhandled_exception_handler(request: Request, exc: Exception):
+    """Log unexpected errors once and return a uniform 500 (HTTPExceptions are handled by FastAPI)"""
+    logger.error(f"Unhandled error on {request.method} {request.url.path}: {exc}")
+    return ORJSONResponse(
+        status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+        content={"detail": f"{type(exc).__name__}: {str(exc) or 'No error message'}"}
+    )
+
 # Initialize services
 db = Database()
-gdpr_engine = GDPREngine(db)
 email_service = EmailService()
 violation_detector = ViolationDetector()
 settlement_service = SettlementService()
@@ -79,14 +146,42 @@ transparency_service = TransparencyService()
 sword_service = SWORDService()
 creditor_portal_service = CreditorPortalService()
 monitoring_service = MonitoringService()
+transparency_cache = TTLCache(
+    ttl_seconds=TRANSPARENCY_CACHE_TTL_SECONDS,
+    refresh_ahead_seconds=TRANSPARENCY_CACHE_REFRESH_AHEAD_SECONDS,
+    max_entries=TRANSPARENCY_CACHE_MAX_ENTRIES
+)
+creditor_report_cache = TTLCache(
+    ttl_seconds=CREDITOR_REPORT_CACHE_TTL_SECONDS,
+    max_entries=CREDITOR_REPORT_CACHE_MAX_ENTRIES
+)
+compliance_snapshot_service = ComplianceSnapshotService(
+    db,
+    transparency_service,
+    max_age=COMPLIANCE_SNAPSHOT_MAX_AGE,
+    on_refresh=transparency_cache.invalidate
+)
+gdpr_engine = GDPREngine(db, compliance_snapshots=compliance_snapshot_service)
 
 @app.on_event("startup")
 async def startup():
     await db.connect()
+    # CPU-bound report aggregation runs here so the event loop stays responsive
+    app.state.process_pool = ProcessPoolExecutor(max_workers=os.cpu_count())
+    app.state.arq_pool = None
+    if REDIS_URL:
+        app.state.arq_pool = await create_pool(RedisSettings.from_dsn(REDIS_URL))
+        logger.info("Connected to GDPR job queue")
     logger.info("GDPR Engine started successfully")
 
 @app.on_event("shutdown")
 async def shutdown():
+    if app.state.arq_pool is not None:
+        await app.state.arq_pool.close()
+    await gdpr_engine.close()
+    await sword_service.close()
+    await email_service.close()
+    app.state.process_pool.shutdown(cancel_futures=True)
     await db.disconnect()
     logger.info("GDPR Engine shutdown completed")
 
@@ -170,17 +265,16 @@ async def generate_gdpr_request(
         )
 
         if last_request:
-            last_created_at = last_request.get('created_at')
-            if last_created_at:
-                time_since_last = datetime.now(last_created_at.tzinfo) - last_created_at
-                cooldown_period = timedelta(hours=GDPR_REQUEST_COOLDOWN_HOURS)
+            created_at_epoch = last_request.get('created_at_epoch')
+            if created_at_epoch is not None:
+                # Epoch arithmetic avoids tz-aware datetime/timedelta work on the rate-limit path
+                remaining_seconds = GDPR_REQUEST_COOLDOWN_SECONDS - (time.time() - created_at_epoch)
 
-                if time_since_last < cooldown_period:
+                if remaining_seconds > 0:
                     # Calculate remaining cooldown time
-                    remaining_time = cooldown_period - time_since_last
-                    remaining_days = int(remaining_time.total_seconds() / 86400)
-                    remaining_hours = int((remaining_time.total_seconds() % 86400) / 3600)
-                    remaining_minutes = int((remaining_time.total_seconds() % 3600) / 60)
+                    remaining_days = int(remaining_seconds / 86400)
+                    remaining_hours = int((remaining_seconds % 86400) / 3600)
+                    remaining_minutes = int((remaining_seconds % 3600) / 60)
 
                     # Sacred Architecture: Educational & empowering message, not restrictive
                     if remaining_days > 0:
@@ -195,8 +289,8 @@ async def generate_gdpr_request(
                             "message": f"Du har allerede sendt en GDPR-forespørsel til denne kreditoren. I følge GDPR har de 30 dager på å svare. La oss gi dem tid til å svare først. {time_message}.",
                             "user_friendly_message": "Vi hjelper deg med å være strategisk. Å vente på svar er smartere enn å sende flere forespørsler.",
                             "legal_context": "GDPR Artikkel 12: Kreditoren har 30 dager svarfrist",
-                            "cooldown_ends_at": (last_created_at + cooldown_period).isoformat(),
-                            "remaining_seconds": int(remaining_time.total_seconds()),
+                            "cooldown_ends_at": (last_request['created_at'] + GDPR_REQUEST_COOLDOWN).isoformat(),
+                            "remaining_seconds": int(remaining_seconds),
                             "next_steps": "Vi overvåker om kreditoren svarer. Hvis de ikke svarer innen fristen, hjelper vi deg med eskalering."
                         }
                     )
@@ -240,12 +334,11 @@ async def send_gdpr_request(
                 detail="Request already sent"
             )
         
-        # Send request in background
-        background_tasks.add_task(
-            gdpr_engine.send_gdpr_request,
-            gdpr_request,
-            background_tasks
-        )
+        # Send request in background (durable queue when available)
+        if app.state.arq_pool is not None:
+            await app.state.arq_pool.enqueue_job('send_gdpr_request', gdpr_request.id)
+        else:
+            background_tasks.add_task(gdpr_engine.send_gdpr_request, gdpr_request)
         
         return {
             "status": "sending",
@@ -277,9 +370,9 @@ async def process_gdpr_response(
                 detail="GDPR request not found"
             )
         
-        # Process response in background
-        background_tasks.add_task(
-            gdpr_engine.process_gdpr_response,
+        # Process response in background (durable queue when available)
+        await _enqueue_response_processing(
+            background_tasks,
             request_id,
             response_data.get("content", b""),
             response_data.get("format", "text")
@@ -332,17 +425,15 @@ async def check_cooldown_status(
         if isinstance(last_sent_at, str):
             last_sent_at = datetime.fromisoformat(last_sent_at.replace('Z', '+00:00'))
 
-        time_since_last = datetime.now(last_sent_at.tzinfo) - last_sent_at
-        cooldown_period = timedelta(hours=GDPR_REQUEST_COOLDOWN_HOURS)
+        remaining_seconds = GDPR_REQUEST_COOLDOWN_SECONDS - (time.time() - last_sent_at.timestamp())
 
-        if time_since_last < cooldown_period:
-            remaining_time = cooldown_period - time_since_last
-            remaining_hours = int(remaining_time.total_seconds() / 3600)
-            remaining_minutes = int((remaining_time.total_seconds() % 3600) / 60)
+        if remaining_seconds > 0:
+            remaining_hours = int(remaining_seconds / 3600)
+            remaining_minutes = int((remaining_seconds % 3600) / 60)
             remaining_days = remaining_hours // 24
             remaining_hours_in_day = remaining_hours % 24
 
-            cooldown_ends_at = last_sent_at + cooldown_period
+            cooldown_ends_at = last_sent_at + GDPR_REQUEST_COOLDOWN
 
             # Sacred Architecture: Educational, not restrictive
             return {
@@ -351,7 +442,7 @@ async def check_cooldown_status(
                 "message": f"Du har sendt en GDPR-forespørsel. Kreditoren har 30 dager på å svare i følge GDPR Artikkel 12.",
                 "timeline_info": "Vi anbefaler å vente på svar før du sender en ny forespørsel. Dette styrker din juridiske posisjon.",
                 "cooldown_ends_at": cooldown_ends_at.isoformat(),
-                "remaining_seconds": int(remaining_time.total_seconds()),
+                "remaining_seconds": int(remaining_seconds),
                 "remaining_hours": remaining_hours,
                 "remaining_days": remaining_days,
                 "last_request_date": last_sent_at.isoformat(),
@@ -494,8 +585,8 @@ async def sendgrid_inbound_webhook(
         # Process response in background
         response_content = html_body.encode('utf-8') if html_body else text_body.encode('utf-8')
 
-        background_tasks.add_task(
-            gdpr_engine.process_gdpr_response,
+        await _enqueue_response_processing(
+            background_tasks,
             request_id,
             response_content,
             "email"
@@ -787,21 +878,26 @@ async def trigger_sword_protocol(
     background_tasks: BackgroundTasks
 ):
     try:
-        # Check if threshold is met
-        stats = await db.get_creditor_violation_stats(creditor_id)
+        # Check if threshold is met (cheap count query; full stats only when needed)
+        threshold_met, _ = await db.check_sword_threshold(creditor_id, SWORD_VIOLATION_THRESHOLD)
 
-        if stats["total_violations"] < 100:  # Threshold
+        if not threshold_met:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="Violation threshold not met"
             )
 
-        # Trigger sword protocol in background
-        background_tasks.add_task(
-            gdpr_engine.trigger_sword_protocol,
-            creditor_id,
-            stats
-        )
+        stats = await db.get_creditor_violation_stats(creditor_id)
+
+        # Trigger sword protocol in background (durable queue when available)
+        if app.state.arq_pool is not None:
+            await app.state.arq_pool.enqueue_job('trigger_sword_protocol', creditor_id, stats)
+        else:
+            background_tasks.add_task(
+                gdpr_engine.trigger_sword_protocol,
+                creditor_id,
+                stats
+            )
 
         return {"status": "sword_triggered"}
 
@@ -839,10 +935,7 @@ async def generate_creditor_transparency_report(creditor_id: str):
             )
 
         # Get all related data
-        violations = await db.get_creditor_violations(creditor_id)
-        gdpr_requests = await db.get_creditor_gdpr_requests(creditor_id)
-        datatilsynet_complaints = await db.get_creditor_datatilsynet_complaints(creditor_id)
-        settlements = await db.get_creditor_settlements(creditor_id)
+        violations, gdpr_requests, datatilsynet_complaints, settlements = await _fetch_creditor_records(creditor_id)
 
         # Convert to dicts
         creditor_data = {
@@ -853,7 +946,8 @@ async def generate_creditor_transparency_report(creditor_id: str):
         }
 
         # Generate transparency report
-        report = await transparency_service.generate_creditor_report(
+        report = await _get_creditor_report(
+            creditor_id,
             creditor_data=creditor_data,
             violations=violations if violations else [],
             gdpr_requests=gdpr_requests if gdpr_requests else [],
@@ -878,7 +972,7 @@ async def generate_creditor_transparency_report(creditor_id: str):
 
 # Get public creditor leaderboard
 @app.get("/transparency/leaderboard")
-async def get_transparency_leaderboard(category: str = "all"):
+async def get_transparency_leaderboard(request: Request, category: str = "all"):
     """
     Get public leaderboard ranking creditors by GDPR compliance.
 
@@ -890,59 +984,62 @@ async def get_transparency_leaderboard(category: str = "all"):
     - Compliance grades
     - Reputation scores
     - Violation counts
+
+    Supports conditional requests: send the returned ETag as If-None-Match
+    to get 304 Not Modified when the leaderboard is unchanged.
     """
-    try:
-        # Get all creditors
-        all_creditors = await db.get_all_creditors()
-
-        # Generate reports for all creditors
-        creditor_reports = []
-        for creditor in all_creditors:
-            creditor_id = creditor.get("id")
-
-            # Get data for each creditor
-            violations = await db.get_creditor_violations(creditor_id)
-            gdpr_requests = await db.get_creditor_gdpr_requests(creditor_id)
-            datatilsynet_complaints = await db.get_creditor_datatilsynet_complaints(creditor_id)
-            settlements = await db.get_creditor_settlements(creditor_id)
-
-            creditor_data = {
-                "name": creditor.get("name", ""),
-                "org_number": creditor.get("org_number", ""),
-                "type": creditor.get("type", "INKASSO")
-            }
+    _validate_leaderboard_category(category)
 
-            # Generate report
-            report = await transparency_service.generate_creditor_report(
-                creditor_data=creditor_data,
-                violations=violations if violations else [],
-                gdpr_requests=gdpr_requests if gdpr_requests else [],
-                datatilsynet_complaints=datatilsynet_complaints if datatilsynet_complaints else [],
-                settlements=settlements if settlements else []
-            )
-            creditor_reports.append(report)
+    try:
+        return await _conditional_json_response(
+            request,
+            ("leaderboard", category),
+            lambda: _compute_leaderboard(category)
+        )
 
-        # Generate leaderboard
-        leaderboard = await transparency_service.generate_leaderboard(
-            creditor_reports=creditor_reports,
-            category=category
+    except Exception as e:
+        logger.error(f"Error generating leaderboard: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to generate leaderboard: {str(e)}"
         )
 
-        logger.info(f"📊 Public leaderboard generated ({category})")
+# Stream public creditor leaderboard as NDJSON
+@app.get("/transparency/leaderboard/stream")
+async def stream_transparency_leaderboard(category: str = "all"):
+    """
+    Stream the public leaderboard as newline-delimited JSON.
+
+    Query params:
+    - category: "all", "best", "worst"
+
+    Emits one ranked creditor per line as soon as it is ready, followed by a
+    final {"leaderboard_summary": {...}} line with aggregate statistics.
+    """
+    _validate_leaderboard_category(category)
+
+    try:
+        creditor_reports = await compliance_snapshot_service.get_creditor_reports()
+
+        async def _stream():
+            async for entry in transparency_service.stream_leaderboard(creditor_reports, category):
+                yield orjson.dumps(entry) + b"\n"
+
+        logger.info(f"📊 Streaming public leaderboard ({category})")
         logger.info(f"   Total creditors: {len(creditor_reports)}")
 
-        return leaderboard
+        return StreamingResponse(_stream(), media_type="application/x-ndjson")
 
     except Exception as e:
-        logger.error(f"Error generating leaderboard: {e}")
+        logger.error(f"Error streaming leaderboard: {e}")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to generate leaderboard: {str(e)}"
+            detail=f"Failed to stream leaderboard: {str(e)}"
         )
 
 # Get industry-wide transparency report
 @app.get("/transparency/industry/{industry}")
-async def get_industry_transparency_report(industry: str = "INKASSO"):
+async def get_industry_transparency_report(request: Request, industry: str = "INKASSO"):
     """
     Get industry-wide GDPR compliance report.
 
@@ -953,54 +1050,21 @@ async def get_industry_transparency_report(industry: str = "INKASSO"):
     - Worst offenders
 
     Supported industries: INKASSO, BANK, TELECOM, OTHER
-    """
-    try:
-        # Get all creditors in industry
-        all_creditors = await db.get_creditors_by_industry(industry)
-
-        if not all_creditors or len(all_creditors) == 0:
-            return {
-                "industry": industry,
-                "message": "No data available for this industry",
-                "total_creditors": 0
-            }
-
-        # Generate reports for all creditors in industry
-        creditor_reports = []
-        for creditor in all_creditors:
-            creditor_id = creditor.get("id")
-
-            violations = await db.get_creditor_violations(creditor_id)
-            gdpr_requests = await db.get_creditor_gdpr_requests(creditor_id)
-            datatilsynet_complaints = await db.get_creditor_datatilsynet_complaints(creditor_id)
-            settlements = await db.get_creditor_settlements(creditor_id)
 
-            creditor_data = {
-                "name": creditor.get("name", ""),
-                "org_number": creditor.get("org_number", ""),
-                "type": creditor.get("type", "INKASSO")
-            }
-
-            report = await transparency_service.generate_creditor_report(
-                creditor_data=creditor_data,
-                violations=violations if violations else [],
-                gdpr_requests=gdpr_requests if gdpr_requests else [],
-                datatilsynet_complaints=datatilsynet_complaints if datatilsynet_complaints else [],
-                settlements=settlements if settlements else []
-            )
-            creditor_reports.append(report)
-
-        # Generate industry report
-        industry_report = await transparency_service.generate_industry_report(
-            creditor_reports=creditor_reports,
-            industry=industry
+    Supports conditional requests via ETag / If-None-Match.
+    """
+    if industry not in SUPPORTED_INDUSTRIES:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=f"Unsupported industry. Must be one of: {', '.join(SUPPORTED_INDUSTRIES)}"
         )
 
-        logger.info(f"📊 Industry transparency report generated for {industry}")
-        logger.info(f"   Total creditors: {len(creditor_reports)}")
-        logger.info(f"   Avg reputation: {industry_report['aggregate_statistics']['avg_reputation_score']}")
-
-        return industry_report
+    try:
+        return await _conditional_json_response(
+            request,
+            ("industry", industry),
+            lambda: _compute_industry_report(industry)
+        )
 
     except Exception as e:
         logger.error(f"Error generating industry report: {e}")
@@ -1011,7 +1075,7 @@ async def get_industry_transparency_report(industry: str = "INKASSO"):
 
 # Mint SWORD token for violation evidence
 @app.post("/sword/mint")
-async def mint_sword_token(sword_request: Dict[str, Any]):
+async def mint_sword_token(sword_request: SwordMintRequest):
     """
     Mint a SWORD (Systematic Whistleblower-Organized Record of Damage) token.
 
@@ -1031,108 +1095,74 @@ async def mint_sword_token(sword_request: Dict[str, Any]):
     - Evidence hash (SHA-256)
     - Immutability proof
     """
-    try:
-        violation_id = sword_request.get("violation_id")
-        creditor_id = sword_request.get("creditor_id")
-        gdpr_request_id = sword_request.get("gdpr_request_id")
-
-        if not all([violation_id, creditor_id]):
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Missing required fields: violation_id, creditor_id"
-            )
-
-        # Get violation data
-        violation = await db.get_violation(violation_id)
-        if not violation:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="Violation not found"
-            )
-
-        # Get creditor data
-        creditor = await db.get_creditor(creditor_id)
-        if not creditor:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="Creditor not found"
-            )
+    # Required fields are validated by SwordMintRequest at parse time
+    violation_id = sword_request.violation_id
+    creditor_id = sword_request.creditor_id
+    gdpr_request_id = sword_request.gdpr_request_id
+
+    # Get violation data
+    violation = await db.get_violation(violation_id)
+    if not violation:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Violation not found"
+        )
 
-        # Get GDPR request if provided
-        gdpr_request = {}
-        if gdpr_request_id:
-            gdpr_request = await db.get_gdpr_request(gdpr_request_id) or {}
+    # Get creditor data
+    creditor = await db.get_creditor(creditor_id)
+    if not creditor:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Creditor not found"
+        )
 
-        # Convert to dicts
-        violation_data = {
-            "id": violation.get("id"),
-            "type": violation.get("type"),
-            "severity": violation.get("severity"),
-            "description": violation.get("description"),
-            "legal_reference": violation.get("legal_reference"),
-            "confidence": violation.get("confidence"),
-            "detected_at": violation.get("detected_at")
-        }
+    # Get GDPR request if provided
+    gdpr_request = {}
+    if gdpr_request_id:
+        gdpr_request = await db.get_gdpr_request(gdpr_request_id) or {}
+
+    # Convert to dicts
+    violation_data = {key: violation.get(key) for key in SWORD_VIOLATION_KEYS}
+    creditor_data = {key: creditor.get(key) for key in SWORD_CREDITOR_KEYS}
+    gdpr_request_data = {key: gdpr_request.get(source) for key, source in SWORD_GDPR_REQUEST_FIELDS}
+
+    # Build evidence package
+    evidence_package = {
+        "violation": violation_data,
+        "creditor": creditor_data,
+        "gdpr_request": gdpr_request_data,
+        "platform": "DAMOCLES",
+        "generated_at": datetime.now().isoformat()
+    }
 
-        creditor_data = {
-            "id": creditor.get("id"),
-            "name": creditor.get("name"),
-            "org_number": creditor.get("org_number"),
-            "type": creditor.get("type")
-        }
+    # Mint SWORD token
+    result = await sword_service.mint_violation_evidence(
+        violation=violation_data,
+        creditor_data=creditor_data,
+        gdpr_request=gdpr_request_data,
+        evidence_package=evidence_package
+    )
 
-        gdpr_request_data = {
-            "id": gdpr_request.get("id"),
-            "sent_at": gdpr_request.get("sent_at"),
-            "deadline": gdpr_request.get("response_due"),
-            "status": gdpr_request.get("status")
+    if not result.get("minted"):
+        return {
+            "minted": False,
+            "reason": result.get("reason")
         }
 
-        # Build evidence package
-        evidence_package = {
-            "violation": violation_data,
-            "creditor": creditor_data,
-            "gdpr_request": gdpr_request_data,
-            "platform": "DAMOCLES",
-            "generated_at": datetime.now().isoformat()
-        }
+    sword_token = result["sword_token"]
 
-        # Mint SWORD token
-        result = await sword_service.mint_violation_evidence(
-            violation=violation_data,
-            creditor_data=creditor_data,
-            gdpr_request=gdpr_request_data,
-            evidence_package=evidence_package
-        )
+    # Store SWORD token in database
+    await db.create_sword_token(sword_token)
+    compliance_snapshot_service.schedule_refresh(sword_token.get("creditor_id"))
 
-        if not result.get("minted"):
-            return {
-                "minted": False,
-                "reason": result.get("reason")
-            }
-
-        sword_token = result["sword_token"]
-
-        # Store SWORD token in database
-        await db.create_sword_token(sword_token)
+    logger.info(f"⚔️  SWORD token minted and stored")
+    logger.info(f"   Asset ID: {sword_token['asset_id']}")
+    logger.info(f"   Blockchain TX: {sword_token['blockchain_tx']}")
 
-        logger.info(f"⚔️  SWORD token minted and stored")
-        logger.info(f"   Asset ID: {sword_token['asset_id']}")
-        logger.info(f"   Blockchain TX: {sword_token['blockchain_tx']}")
-
-        return {
-            "minted": True,
-            "sword_token": sword_token
-        }
-
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"Error minting SWORD token: {e}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to mint SWORD token: {str(e)}"
-        )
+    return {
+        "minted": True,
+        "sword_token": sword_token
+    }
 
 # Verify SWORD token on blockchain
 @app.get("/sword/verify/{asset_id}")
@@ -1166,7 +1196,7 @@ async def verify_sword_token(asset_id: str):
 
 # Get all SWORD tokens for creditor
 @app.get("/sword/creditor/{creditor_id}")
-async def get_creditor_sword_tokens(creditor_id: str):
+async def get_creditor_sword_tokens(creditor_id: str, verify: bool = False):
     """
     Get all SWORD tokens minted for a specific creditor.
 
@@ -1177,6 +1207,7 @@ async def get_creditor_sword_tokens(creditor_id: str):
     - Severity breakdown
     - Violation type distribution
     - Legal summary for court
+    - Blockchain evidence verification per token (when verify=true)
     """
     try:
         # Get all SWORD tokens for this creditor from database
@@ -1188,6 +1219,12 @@ async def get_creditor_sword_tokens(creditor_id: str):
             sword_tokens_db=sword_tokens if sword_tokens else []
         )
 
+        if verify:
+            tx_ids = [token["blockchain_tx"] for token in analysis["tokens"] if token.get("blockchain_tx")]
+            verifications = await _verify_evidence_in_batches(tx_ids)
+            for token in analysis["tokens"]:
+                token["verification"] = verifications.get(token.get("blockchain_tx"))
+
         logger.info(f"⚔️  Retrieved SWORD tokens for creditor {creditor_id}")
         logger.info(f"   Total tokens: {analysis['total_sword_tokens']}")
 
@@ -1221,16 +1258,19 @@ async def get_creditor_dashboard(creditor_id: str):
         if not creditor:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Creditor not found")
 
-        # Get all related data
-        gdpr_requests = await db.get_creditor_gdpr_requests(creditor_id)
-        violations = await db.get_creditor_violations(creditor_id)
-        settlements = await db.get_creditor_settlements(creditor_id)
-        datatilsynet_complaints = await db.get_creditor_datatilsynet_complaints(creditor_id)
-        sword_tokens = await db.get_creditor_sword_tokens(creditor_id)
+        # Get all related data (independent queries, fetched concurrently)
+        gdpr_requests, violations, settlements, datatilsynet_complaints, sword_tokens = await asyncio.gather(
+            db.get_creditor_gdpr_requests(creditor_id),
+            db.get_creditor_violations(creditor_id),
+            db.get_creditor_settlements(creditor_id),
+            db.get_creditor_datatilsynet_complaints(creditor_id),
+            db.get_creditor_sword_tokens(creditor_id)
+        )
 
         # Get transparency report
         creditor_data = {"name": creditor.get("name"), "org_number": creditor.get("org_number"), "type": creditor.get("type")}
-        transparency_report = await transparency_service.generate_creditor_report(
+        transparency_report = await _get_creditor_report(
+            creditor_id,
             creditor_data=creditor_data,
             violations=violations or [],
             gdpr_requests=gdpr_requests or [],
@@ -1251,7 +1291,7 @@ async def get_creditor_dashboard(creditor_id: str):
         )
 
         logger.info(f"📊 Creditor dashboard accessed: {creditor_data['name']}")
-        return dashboard
+        return _view_response(dashboard)
 
     except HTTPException:
         raise
@@ -1287,8 +1327,15 @@ async def submit_gdpr_response(gdpr_request_id: str, response: Dict[str, Any]):
             response_data=response
         )
 
-        # Update GDPR request status
-        await db.update_gdpr_request_status(gdpr_request_id, "RESPONDED")
+        # Store response and update GDPR request status in one transaction
+        if not await db.submit_gdpr_response_tx(gdpr_request_id, creditor_id, result):
+            raise HTTPException(
+                status_code=status.HTTP_502_BAD_GATEWAY,
+                detail="Failed to store GDPR response"
+            )
+
+        compliance_snapshot_service.schedule_refresh(creditor_id)
+        creditor_portal_service.apply_delta(creditor_id, {"type": "gdpr_request_responded"})
 
         logger.info(f"✅ GDPR response submitted by creditor {creditor_id}")
         return result
@@ -1329,6 +1376,15 @@ async def submit_settlement_response(settlement_id: str, response: Dict[str, Any
             notes=response.get("notes")
         )
 
+        if not await db.submit_settlement_response_tx(settlement_id, creditor_id, result):
+            raise HTTPException(
+                status_code=status.HTTP_502_BAD_GATEWAY,
+                detail="Failed to store settlement response"
+            )
+
+        compliance_snapshot_service.schedule_refresh(creditor_id)
+        creditor_portal_service.invalidate(creditor_id)
+
         logger.info(f"💼 Settlement response: {action} by creditor {creditor_id}")
         return result
 
@@ -1340,24 +1396,30 @@ async def submit_settlement_response(settlement_id: str, response: Dict[str, Any
 
 # Creditor Portal: View violations
 @app.get("/creditor-portal/violations/{creditor_id}")
-async def get_creditor_violations_portal(creditor_id: str, severity: Optional[str] = None, type: Optional[str] = None):
-    """Get all violations for creditor with optional filtering"""
+async def get_creditor_violations_portal(
+    creditor_id: str,
+    severity: Optional[str] = None,
+    type: Optional[str] = None,
+    limit: Optional[int] = None,
+    offset: Optional[int] = None
+):
+    """Get all violations for creditor with optional filtering and pagination"""
     try:
-        violations = await db.get_creditor_violations(creditor_id)
-
-        filters = {}
-        if severity:
-            filters["severity"] = severity
-        if type:
-            filters["type"] = type
+        # Severity/type filters and pagination are applied by the database query
+        violations = await db.get_creditor_violations(
+            creditor_id,
+            severity=severity,
+            violation_type=type,
+            limit=limit,
+            offset=offset
+        )
 
         result = await creditor_portal_service.view_violations(
             creditor_id=creditor_id,
-            violations=violations or [],
-            filters=filters if filters else None
+            violations=violations or []
         )
 
-        return result
+        return _view_response(result)
 
     except Exception as e:
         logger.error(f"Error fetching creditor violations: {e}")
@@ -1378,21 +1440,20 @@ async def request_improvement_plan(creditor_id: str, plan_request: Dict[str, Any
         target_grade = plan_request.get("target_grade", "B")
 
         # Get current data
-        violations = await db.get_creditor_violations(creditor_id)
-        gdpr_requests = await db.get_creditor_gdpr_requests(creditor_id)
+        violations, gdpr_requests = await asyncio.gather(
+            db.get_creditor_violations(creditor_id),
+            db.get_creditor_gdpr_requests(creditor_id)
+        )
 
-        # Get transparency report for current grade
-        creditor = await db.get_creditor(creditor_id)
-        creditor_data = {"name": creditor.get("name"), "org_number": creditor.get("org_number"), "type": creditor.get("type")}
-        transparency_report = await transparency_service.generate_creditor_report(
-            creditor_data=creditor_data,
+        # Only the current grade is needed, not the full transparency report
+        compliance_grade = transparency_service.compute_grade_only(
             violations=violations or [],
             gdpr_requests=gdpr_requests or [],
             datatilsynet_complaints=[],
             settlements=[]
         )
 
-        current_grade = transparency_report.get("compliance_grade", {}).get("grade", "F")
+        current_grade = compliance_grade.get("grade", "F")
 
         # Generate improvement plan
         plan = await creditor_portal_service.request_score_improvement_plan(
@@ -1525,16 +1586,172 @@ async def trigger_escalation_check():
         logger.error(f"Traceback: {error_details}")
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=f"{type(e).__name__}: {str(e) or 'No error message'}")
 
-def _get_severity_breakdown(violations: List[Dict]) -> Dict[str, int]:
-    """Get breakdown of violations by severity"""
-    breakdown = {"critical": 0, "high": 0, "medium": 0, "low": 0}
+async def _fetch_creditor_records(creditor_id: str):
+    """Fetch violations, GDPR requests, Datatilsynet complaints and settlements concurrently"""
+    return await asyncio.gather(
+        db.get_creditor_violations(creditor_id),
+        db.get_creditor_gdpr_requests(creditor_id),
+        db.get_creditor_datatilsynet_complaints(creditor_id),
+        db.get_creditor_settlements(creditor_id)
+    )
+
+async def _get_creditor_report(
+    creditor_id: str,
+    creditor_data: Dict[str, Any],
+    violations: List[Dict[str, Any]],
+    gdpr_requests: List[Dict[str, Any]],
+    datatilsynet_complaints: List[Dict[str, Any]],
+    settlements: List[Dict[str, Any]]
+) -> Dict[str, Any]:
+    """Generate a creditor transparency report, reusing a recent one built from the same data"""
+    # Cheap proxy for a content hash of the report inputs
+    data_version = (
+        len(violations),
+        max((str(v.get("id", "")) for v in violations), default=""),
+        len(gdpr_requests),
+        sum(1 for r in gdpr_requests if r.get("status") == "RESPONDED"),
+        len(datatilsynet_complaints),
+        len(settlements)
+    )
+
+    return await creditor_report_cache.get_or_compute(
+        (creditor_id, data_version),
+        lambda: transparency_service.generate_creditor_report(
+            creditor_data=creditor_data,
+            violations=violations,
+            gdpr_requests=gdpr_requests,
+            datatilsynet_complaints=datatilsynet_complaints,
+            settlements=settlements
+        )
+    )
+
+async def _conditional_json_response(request: Request, cache_key, compute) -> Response:
+    """Serve a cached transparency payload with an ETag, answering 304 when the client copy is current"""
+    etag, body = await transparency_cache.get_or_compute(
+        cache_key,
+        lambda: _serialize_with_etag(compute)
+    )
+
+    if_none_match = request.headers.get("if-none-match", "")
+    if etag in (tag.strip() for tag in if_none_match.split(",")):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+
+    return Response(content=body, media_type="application/json", headers={"ETag": etag})
+
+def _orjson_default(value):
+    """Fallback for database values orjson cannot serialise natively"""
+    if isinstance(value, Decimal):
+        return float(value)
+    raise TypeError
+
+def _view_response(view) -> Response:
+    """Serialise a slotted portal view straight to JSON, skipping jsonable_encoder"""
+    return Response(
+        content=orjson.dumps(view, default=_orjson_default),
+        media_type="application/json"
+    )
+
+async def _serialize_with_etag(compute):
+    """Serialise a payload once and derive its ETag from the content (ignoring generated_at)"""
+    payload = await compute()
+    body = orjson.dumps(payload)
+
+    content = {key: value for key, value in payload.items() if key != "generated_at"}
+    digest = hashlib.blake2b(orjson.dumps(content, option=orjson.OPT_SORT_KEYS), digest_size=16).hexdigest()
+
+    return f'"{digest}"', body
+
+def _validate_leaderboard_category(category: str):
+    """Reject unknown leaderboard categories before they reach the cache"""
+    if category not in LEADERBOARD_CATEGORIES:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=f"Invalid category. Must be one of: {', '.join(LEADERBOARD_CATEGORIES)}"
+        )
+
+async def _compute_leaderboard(category: str) -> Dict[str, Any]:
+    """Build the public leaderboard (cached by get_transparency_leaderboard)"""
+    # Get stored compliance snapshots for all creditors
+    creditor_reports = await compliance_snapshot_service.get_creditor_reports()
+
+    # Generate leaderboard
+    leaderboard = await transparency_service.generate_leaderboard(
+        creditor_reports=creditor_reports,
+        category=category
+    )
+
+    logger.info(f"📊 Public leaderboard generated ({category})")
+    logger.info(f"   Total creditors: {len(creditor_reports)}")
+
+    return leaderboard
 
-    for violation in violations:
-        severity = violation.get("severity", "low")
-        if severity in breakdown:
-            breakdown[severity] += 1
+async def _compute_industry_report(industry: str) -> Dict[str, Any]:
+    """Build the industry report (cached by get_industry_transparency_report)"""
+    # Get stored compliance snapshots for all creditors in industry
+    creditor_reports = await compliance_snapshot_service.get_creditor_reports(industry)
+
+    if not creditor_reports:
+        return {
+            "industry": industry,
+            "message": "No data available for this industry",
+            "total_creditors": 0
+        }
+
+    # Generate industry report off the event loop (CPU-bound aggregation)
+    industry_report = await asyncio.get_running_loop().run_in_executor(
+        app.state.process_pool,
+        transparency_service.generate_industry_report_sync,
+        creditor_reports,
+        industry
+    )
+
+    logger.info(f"📊 Industry transparency report generated for {industry}")
+    logger.info(f"   Total creditors: {len(creditor_reports)}")
+    logger.info(f"   Avg reputation: {industry_report['aggregate_statistics']['avg_reputation_score']}")
+
+    return industry_report
+
+async def _verify_evidence_in_batches(tx_ids: List[str]) -> Dict[str, Any]:
+    """Verify blockchain evidence in chunks so N tokens cost ceil(N / batch size) round-trips"""
+    chunks = [
+        tx_ids[i:i + EVIDENCE_VERIFY_BATCH_SIZE]
+        for i in range(0, len(tx_ids), EVIDENCE_VERIFY_BATCH_SIZE)
+    ]
+    results = await asyncio.gather(*(
+        gdpr_engine.blockchain_client.verify_evidence_batch(chunk) for chunk in chunks
+    ))
+
+    verifications = {}
+    for result in results:
+        verifications.update(result)
+    return verifications
+
+async def _enqueue_response_processing(
+    background_tasks: BackgroundTasks,
+    request_id: str,
+    response_content: bytes,
+    response_format: str
+):
+    """Queue GDPR response processing on the worker, or run it in-process without Redis"""
+    if app.state.arq_pool is not None:
+        await app.state.arq_pool.enqueue_job(
+            'process_gdpr_response',
+            request_id,
+            response_content,
+            response_format
+        )
+    else:
+        background_tasks.add_task(
+            gdpr_engine.process_gdpr_response,
+            request_id,
+            response_content,
+            response_format
+        )
 
-    return breakdown
+def _get_severity_breakdown(violations: List[Dict]) -> Dict[str, int]:
+    """Get breakdown of violations by severity"""
+    counts = Counter(violation.get("severity", "low") for violation in violations)
+    return {severity: counts[severity] for severity in ("critical", "high", "medium", "low")}
 
 if __name__ == "__main__":
     import uvicorn
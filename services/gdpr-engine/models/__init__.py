@@ -2,20 +2,25 @@ from .gdpr import (
     GDPRRequest, 
     GDPRRequestCreate, 
     GDPRResponse, 
+    SwordMintRequest,
     Violation, 
+    ViolationRow,
     ViolationType,
     GDPRTemplate,
     TrackingEvent,
     EscalationRequest
 )
 from .user import User, UserCreate, UserUpdate
-from .creditor import Creditor, CreditorCreate, CreditorUpdate
+from .creditor import Creditor, CreditorRow, CreditorCreate, CreditorUpdate
+from .portal import ComplianceSummary, CreditorRef, DashboardView, ViolationsView
 
 __all__ = [
     'GDPRRequest',
     'GDPRRequestCreate', 
     'GDPRResponse',
+    'SwordMintRequest',
     'Violation',
+    'ViolationRow',
     'ViolationType',
     'GDPRTemplate',
     'TrackingEvent',
@@ -24,6 +29,11 @@ __all__ = [
     'UserCreate',
     'UserUpdate',
     'Creditor',
+    'CreditorRow',
     'CreditorCreate',
-    'CreditorUpdate'
+    'CreditorUpdate',
+    'CreditorRef',
+    'ComplianceSummary',
+    'DashboardView',
+    'ViolationsView'
 ]
\ No newline at end of file
@@ -1,6 +1,7 @@
 from pydantic import BaseModel, EmailStr
-from typing import Optional
+from typing import Optional, TypedDict
 from datetime import datetime
+from functools import cached_property
 
 class Creditor(BaseModel):
     id: str
@@ -18,6 +19,19 @@ class Creditor(BaseModel):
     class Config:
         from_attributes = True
 
+    @cached_property
+    def fallback_privacy_email(self) -> str:
+        """Best-guess post@ address for creditors without a registered privacy email"""
+        return f"post@{self.name.lower().replace(' ', '')}.no"
+
+class CreditorRow(TypedDict, total=False):
+    """Raw creditor row for bulk read paths (no validation)"""
+    id: str
+    name: str
+    org_number: Optional[str]
+    type: str
+    email: Optional[str]
+
 class CreditorCreate(BaseModel):
     name: str
     organization_number: Optional[str] = None
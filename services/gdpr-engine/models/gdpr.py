@@ -1,5 +1,5 @@
 from pydantic import BaseModel, Field
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, TypedDict
 from datetime import datetime
 from enum import Enum
 
@@ -15,6 +15,11 @@ class GDPRRequestCreate(BaseModel):
     request_type: str = Field(default="article_15", description="Type of GDPR request")
     custom_message: Optional[str] = Field(None, description="Additional custom message")
 
+class SwordMintRequest(BaseModel):
+    violation_id: str = Field(..., min_length=1, description="Violation to mint evidence for")
+    creditor_id: str = Field(..., min_length=1, description="Creditor the violation belongs to")
+    gdpr_request_id: Optional[str] = Field(None, description="Originating GDPR request")
+
 class GDPRRequest(BaseModel):
     id: str
     user_id: str
@@ -70,6 +75,18 @@ class Violation(BaseModel):
     class Config:
         from_attributes = True
 
+class ViolationRow(TypedDict, total=False):
+    """Raw violation row for bulk read paths (no validation)"""
+    id: str
+    gdpr_request_id: Optional[str]
+    creditor_id: str
+    type: str
+    severity: str
+    confidence: float
+    estimated_damage: float
+    status: str
+    created_at: str
+
 class GDPRTemplate(BaseModel):
     id: str
     name: str
@@ -0,0 +1,42 @@
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+
+# Creditor portal read views. Plain slotted dataclasses rather than pydantic
+# models: they are built from already-validated data on every portal request
+# and serialised directly by orjson, so validation would be pure overhead.
+
+@dataclass(slots=True)
+class CreditorRef:
+    id: str
+    name: Optional[str]
+    org_number: Optional[str]
+    type: Optional[str]
+
+@dataclass(slots=True)
+class ComplianceSummary:
+    grade: str
+    reputation_score: float
+    total_violations: int
+    pending_gdpr_requests: int
+    active_settlements: int
+    datatilsynet_complaints: int
+    sword_tokens_minted: int
+
+@dataclass(slots=True)
+class DashboardView:
+    creditor: CreditorRef
+    compliance_summary: ComplianceSummary
+    urgent_actions: List[Dict[str, Any]]
+    trends: Dict[str, Any]
+    recent_activity: List[Dict[str, Any]]
+    dashboard_generated_at: str
+
+@dataclass(slots=True)
+class ViolationsView:
+    creditor_id: str
+    total_violations: int
+    by_severity: Dict[str, Dict[str, int]]
+    by_type: Dict[str, Dict[str, int]]
+    violations: List[Dict[str, Any]]
+    filters_applied: Dict[str, Any]
+    retrieved_at: str
@@ -1,7 +1,9 @@
 import aiohttp
+import asyncio
 import json
 import logging
-from typing import Dict, Any, Optional
+import orjson
+from typing import Dict, Any, List, Optional
 
 logger = logging.getLogger(__name__)
 
@@ -12,6 +14,29 @@ class BlockchainClient:
         self.base_url = blockchain_service_url
         self.api_base = f"{self.base_url}/api"
 
+        # Shared HTTP session (keep-alive + DNS cache), created lazily on first use
+        self._session: Optional[aiohttp.ClientSession] = None
+
+        # Flipped off the first time the service answers 404 for the batch endpoint
+        self._batch_verify_supported = True
+
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Return the pooled client session, creating it on first use"""
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=64, keepalive_timeout=30),
+                timeout=aiohttp.ClientTimeout(total=10),
+                # orjson for request bodies (large documentContent evidence payloads)
+                json_serialize=lambda obj: orjson.dumps(obj).decode()
+            )
+        return self._session
+
+    async def close(self):
+        """Close the pooled client session"""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
     async def create_evidence(
         self,
         case_id: str,
@@ -29,21 +54,21 @@ class BlockchainClient:
         }
 
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.post(
-                    f"{self.api_base}/evidence/create",
-                    json=payload,
-                    headers={"Content-Type": "application/json"}
-                ) as response:
-
-                    if response.status == 200:
-                        result = await response.json()
-                        logger.info(f"✅ Blockchain evidence created successfully: {result.get('txId')}")
-                        return result
-                    else:
-                        error_text = await response.text()
-                        logger.error(f"❌ Failed to create blockchain evidence: {response.status} - {error_text}")
-                        return None
+            session = await self._get_session()
+            async with session.post(
+                f"{self.api_base}/evidence/create",
+                json=payload,
+                headers={"Content-Type": "application/json"}
+            ) as response:
+
+                if response.status == 200:
+                    result = await response.json(loads=orjson.loads)
+                    logger.info(f"✅ Blockchain evidence created successfully: {result.get('txId')}")
+                    return result
+                else:
+                    error_text = await response.text()
+                    logger.error(f"❌ Failed to create blockchain evidence: {response.status} - {error_text}")
+                    return None
 
         except Exception as e:
             logger.error(f"❌ Error creating blockchain evidence: {str(e)}")
@@ -53,41 +78,85 @@ class BlockchainClient:
         """Verify blockchain evidence by transaction ID"""
 
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(
-                    f"{self.api_base}/evidence/verify/{tx_id}"
-                ) as response:
-
-                    if response.status == 200:
-                        result = await response.json()
-                        logger.info(f"✅ Evidence verification successful: {tx_id}")
-                        return result
-                    else:
-                        error_text = await response.text()
-                        logger.error(f"❌ Failed to verify evidence: {response.status} - {error_text}")
-                        return None
+            session = await self._get_session()
+            async with session.get(
+                f"{self.api_base}/evidence/verify/{tx_id}"
+            ) as response:
+
+                if response.status == 200:
+                    result = await response.json(loads=orjson.loads)
+                    logger.info(f"✅ Evidence verification successful: {tx_id}")
+                    return result
+                else:
+                    error_text = await response.text()
+                    logger.error(f"❌ Failed to verify evidence: {response.status} - {error_text}")
+                    return None
 
         except Exception as e:
             logger.error(f"❌ Error verifying evidence: {str(e)}")
             return None
 
-    async def get_legal_package(self, case_id: str) -> Optional[Dict[str, Any]]:
-        """Get legal evidence package for court proceedings"""
+    async def verify_evidence_batch(self, tx_ids: List[str]) -> Dict[str, Optional[Dict[str, Any]]]:
+        """
+        Verify many blockchain evidence records in one request.
 
-        try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(
-                    f"{self.api_base}/evidence/legal-package/{case_id}"
+        Returns a mapping of transaction ID to its verification result (None when
+        verification failed). Falls back to per-ID verification when the
+        blockchain service does not expose the batch endpoint.
+        """
+
+        if not tx_ids:
+            return {}
+
+        if self._batch_verify_supported:
+            try:
+                session = await self._get_session()
+                async with session.post(
+                    f"{self.api_base}/evidence/verify-batch",
+                    json={"txIds": tx_ids},
+                    headers={"Content-Type": "application/json"}
                 ) as response:
 
                     if response.status == 200:
-                        result = await response.json()
-                        logger.info(f"✅ Legal package retrieved for case: {case_id}")
-                        return result
+                        result = await response.json(loads=orjson.loads)
+                        verified = {
+                            item.get("txId"): item
+                            for item in result.get("results", [])
+                        }
+                        logger.info(f"✅ Batch evidence verification successful: {len(verified)}/{len(tx_ids)}")
+                        return {tx_id: verified.get(tx_id) for tx_id in tx_ids}
+                    elif response.status == 404:
+                        logger.warning("⚠️ Batch verification endpoint not available, falling back to per-ID verification")
+                        self._batch_verify_supported = False
                     else:
                         error_text = await response.text()
-                        logger.error(f"❌ Failed to get legal package: {response.status} - {error_text}")
-                        return None
+                        logger.error(f"❌ Failed to batch verify evidence: {response.status} - {error_text}")
+                        return {tx_id: None for tx_id in tx_ids}
+
+            except Exception as e:
+                logger.error(f"❌ Error batch verifying evidence: {str(e)}")
+                return {tx_id: None for tx_id in tx_ids}
+
+        results = await asyncio.gather(*(self.verify_evidence(tx_id) for tx_id in tx_ids))
+        return dict(zip(tx_ids, results))
+
+    async def get_legal_package(self, case_id: str) -> Optional[Dict[str, Any]]:
+        """Get legal evidence package for court proceedings"""
+
+        try:
+            session = await self._get_session()
+            async with session.get(
+                f"{self.api_base}/evidence/legal-package/{case_id}"
+            ) as response:
+
+                if response.status == 200:
+                    result = await response.json(loads=orjson.loads)
+                    logger.info(f"✅ Legal package retrieved for case: {case_id}")
+                    return result
+                else:
+                    error_text = await response.text()
+                    logger.error(f"❌ Failed to get legal package: {response.status} - {error_text}")
+                    return None
 
         except Exception as e:
             logger.error(f"❌ Error retrieving legal package: {str(e)}")
@@ -97,17 +166,17 @@ class BlockchainClient:
         """Check if blockchain service is healthy"""
 
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(
-                    f"{self.base_url}/health",
-                    timeout=aiohttp.ClientTimeout(total=5)
-                ) as response:
-
-                    if response.status == 200:
-                        result = await response.json()
-                        return result.get("status") == "healthy"
-                    else:
-                        return False
+            session = await self._get_session()
+            async with session.get(
+                f"{self.base_url}/health",
+                timeout=aiohttp.ClientTimeout(total=5)
+            ) as response:
+
+                if response.status == 200:
+                    result = await response.json(loads=orjson.loads)
+                    return result.get("status") == "healthy"
+                else:
+                    return False
 
         except Exception as e:
             logger.error(f"❌ Blockchain service health check failed: {str(e)}")
@@ -0,0 +1,237 @@
+"""
+Compliance Snapshot Service
+Materialises creditor transparency reports so public read paths skip re-aggregation
+
+Reports only change when violations, GDPR requests, SWORD tokens or settlements
+are written, so they are refreshed on those writes and read back as stored rows.
+"""
+
+import asyncio
+import logging
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, List, Optional, Set
+
+from database import Database
+from services.transparency_service import TransparencyService
+
+logger = logging.getLogger(__name__)
+
+# Finished reports buffered ahead of the snapshot writer during a rebuild
+SNAPSHOT_WRITE_QUEUE_SIZE = 4
+
+
+class ComplianceSnapshotService:
+    """Keeps creditor_compliance_snapshot rows in sync with creditor activity"""
+
+    def __init__(
+        self,
+        database: Database,
+        transparency_service: TransparencyService,
+        max_age: timedelta = timedelta(minutes=30),
+        on_refresh: Optional[Callable[[], Any]] = None
+    ):
+        self.db = database
+        self.transparency_service = transparency_service
+
+        # Snapshots older than this are rebuilt from live data on read
+        self.max_age = max_age
+
+        # Called after a snapshot refresh lands (e.g. to drop cached leaderboards)
+        self.on_refresh = on_refresh
+
+        self._refresh_tasks: Set[asyncio.Task] = set()
+
+        # In-flight live rebuilds keyed by industry (None = all creditors)
+        self._inflight: Dict[Optional[str], asyncio.Future] = {}
+
+    async def get_creditor_reports(self, industry: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        Return transparency reports for all creditors (optionally one industry).
+
+        Served from stored snapshots when every active creditor in scope has
+        one and none is older than max_age; otherwise (missing creditors, stale
+        rows, or an unknown creditor set) rebuilt live from the bulk leaderboard
+        dataset.
+        """
+
+        snapshots, creditor_ids = await asyncio.gather(
+            self.db.get_compliance_snapshots(industry),
+            self.db.get_active_creditor_ids(industry)
+        )
+        oldest_allowed = datetime.now() - self.max_age
+
+        if creditor_ids:
+            # Skip rows for creditors that have since been deactivated
+            current = [snapshot for snapshot in snapshots if snapshot["creditor_id"] in creditor_ids]
+
+            if (
+                len(current) == len(creditor_ids)
+                and all(snapshot["updated_at"] >= oldest_allowed for snapshot in current)
+            ):
+                return [snapshot["report_json"] for snapshot in current]
+
+        return await self._rebuild(industry)
+
+    async def _rebuild(self, industry: Optional[str]) -> List[Dict[str, Any]]:
+        """Rebuild reports from live data, coalescing concurrent rebuilds of the same scope"""
+
+        inflight = self._inflight.get(industry)
+        if inflight is not None:
+            return await asyncio.shield(inflight)
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[industry] = future
+
+        try:
+            logger.info(f"📸 Compliance snapshots missing or stale ({industry or 'all'}), rebuilding from live data")
+            dataset = await self.db.get_leaderboard_dataset(industry)
+            reports = await self.build_reports(dataset)
+            future.set_result(reports)
+            return reports
+
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+
+        except Exception as e:
+            future.set_exception(e)
+            # Waiters receive the error; mark it retrieved so it is not reported as unhandled
+            future.exception()
+            raise
+
+        finally:
+            self._inflight.pop(industry, None)
+
+    async def build_reports(self, dataset: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Generate reports from a prefetched leaderboard dataset and persist them as snapshots.
+
+        Report generation and snapshot writes run as a pipeline: a writer task
+        persists finished reports while the next creditors are being scored, so
+        the rebuild costs max(compute, write) per creditor rather than their sum.
+        """
+
+        write_queue: asyncio.Queue = asyncio.Queue(maxsize=SNAPSHOT_WRITE_QUEUE_SIZE)
+        writer = asyncio.create_task(self._write_snapshots(write_queue))
+
+        creditor_reports = []
+        try:
+            for entry in dataset:
+                creditor = entry["creditor"]
+
+                report = await self._generate_report(
+                    creditor,
+                    violations=entry["violations"],
+                    gdpr_requests=entry["gdpr_requests"],
+                    datatilsynet_complaints=entry["datatilsynet_complaints"],
+                    settlements=entry["settlements"]
+                )
+
+                await write_queue.put((creditor, report))
+                creditor_reports.append(report)
+
+            await write_queue.put(None)
+            await writer
+
+        finally:
+            if not writer.done():
+                writer.cancel()
+
+        return creditor_reports
+
+    async def _write_snapshots(self, write_queue: asyncio.Queue):
+        """Persist (creditor, report) pairs from the queue until a None sentinel arrives"""
+
+        while True:
+            item = await write_queue.get()
+            if item is None:
+                return
+
+            creditor, report = item
+            try:
+                await self.db.upsert_compliance_snapshot(
+                    creditor_id=creditor.get("id"),
+                    creditor_type=creditor.get("type", "INKASSO"),
+                    report=report
+                )
+            except Exception as e:
+                logger.error(f"❌ Failed to store compliance snapshot for {creditor.get('id')}: {str(e)}")
+
+    def schedule_refresh(self, creditor_id: Optional[str]):
+        """Refresh a creditor's snapshot in the background after a write"""
+
+        if not creditor_id:
+            return
+
+        task = asyncio.create_task(self.refresh(creditor_id))
+        self._refresh_tasks.add(task)
+        task.add_done_callback(self._refresh_tasks.discard)
+
+    async def refresh(self, creditor_id: str):
+        """Recompute and store the snapshot for one creditor"""
+
+        try:
+            creditor_model = await self.db.get_creditor(creditor_id)
+            if not creditor_model:
+                logger.warning(f"⚠️ Creditor {creditor_id} not found, skipping snapshot refresh")
+                return
+
+            # get_creditor returns the Creditor model; reports are built from plain creditor rows
+            creditor = {
+                "id": creditor_model.id,
+                "name": creditor_model.name,
+                "org_number": creditor_model.organization_number,
+                "type": creditor_model.type
+            }
+
+            violations, gdpr_requests, datatilsynet_complaints, settlements = await asyncio.gather(
+                self.db.get_creditor_violations(creditor_id),
+                self.db.get_creditor_gdpr_requests(creditor_id),
+                self.db.get_creditor_datatilsynet_complaints(creditor_id),
+                self.db.get_creditor_settlements(creditor_id)
+            )
+
+            report = await self._generate_report(
+                creditor,
+                violations=violations or [],
+                gdpr_requests=gdpr_requests or [],
+                datatilsynet_complaints=datatilsynet_complaints or [],
+                settlements=settlements or []
+            )
+
+            await self.db.upsert_compliance_snapshot(
+                creditor_id=creditor_id,
+                creditor_type=creditor.get("type", "INKASSO"),
+                report=report
+            )
+
+            logger.info(f"📸 Compliance snapshot refreshed for creditor {creditor_id}")
+
+        except Exception as e:
+            logger.error(f"❌ Failed to refresh compliance snapshot for {creditor_id}: {str(e)}")
+
+        finally:
+            if self.on_refresh:
+                self.on_refresh()
+
+    async def _generate_report(
+        self,
+        creditor: Dict[str, Any],
+        violations: List[Dict[str, Any]],
+        gdpr_requests: List[Dict[str, Any]],
+        datatilsynet_complaints: List[Dict[str, Any]],
+        settlements: List[Dict[str, Any]]
+    ) -> Dict[str, Any]:
+        creditor_data = {
+            "name": creditor.get("name", ""),
+            "org_number": creditor.get("org_number", ""),
+            "type": creditor.get("type", "INKASSO")
+        }
+
+        return await self.transparency_service.generate_creditor_report(
+            creditor_data=creditor_data,
+            violations=violations,
+            gdpr_requests=gdpr_requests,
+            datatilsynet_complaints=datatilsynet_complaints,
+            settlements=settlements
+        )
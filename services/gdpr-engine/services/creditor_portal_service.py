@@ -5,18 +5,120 @@ Provides API for creditors to view violations, respond to GDPR requests, and neg
 Sacred Architecture: Transparency gives creditors opportunity to self-correct
 """
 
-from typing import Dict, List, Any, Optional
+import heapq
+from collections import Counter
+from functools import lru_cache
+from itertools import islice
+from typing import Dict, List, Any, Optional, Tuple
 from datetime import datetime, timedelta
 import logging
 import hashlib
 import secrets
 
+from models.portal import ComplianceSummary, CreditorRef, DashboardView, ViolationsView
+
 logger = logging.getLogger(__name__)
 
+# GDPR requests still awaiting a creditor response
+_PENDING_STATUSES = frozenset({"PENDING", "SENT"})
+
+# Settlements still open for negotiation
+_ACTIVE_SETTLEMENT_STATUSES = frozenset({"pending", "negotiating"})
+
+# What each compliance grade requires (used by improvement plans)
+GRADE_REQUIREMENTS = {
+    "A": {"response_rate": 95, "avg_response_days": 15, "max_violations": 10},
+    "B": {"response_rate": 85, "avg_response_days": 20, "max_violations": 25},
+    "C": {"response_rate": 70, "avg_response_days": 25, "max_violations": 50},
+    "D": {"response_rate": 50, "avg_response_days": 30, "max_violations": 100}
+}
+
+# Pre-aggregated dashboard summaries are recomputed at least this often, so the
+# 30/60-day trend windows never drift far from the wall clock
+DASHBOARD_SUMMARY_MAX_AGE = timedelta(minutes=15)
+
+# Violation dispute review period and compliance trend windows
+DISPUTE_REVIEW_PERIOD = timedelta(days=14)
+TREND_WINDOW = timedelta(days=30)
+
+
+def _pending_settlement_item(settlement: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        "type": "pending_settlement",
+        "priority": "medium",
+        "message": "Forlikstilbud venter på svar",
+        "settlement_id": settlement.get("id"),
+        "amount": settlement.get("settlement_amount")
+    }
+
+
+def _open_complaint_item(complaint: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        "type": "datatilsynet_complaint",
+        "priority": "critical",
+        "message": "Klage til Datatilsynet under behandling",
+        "complaint_id": complaint.get("id"),
+        "estimated_fine": complaint.get("estimated_fine")
+    }
+
+
+# status -> (priority bucket, urgent item builder) for settlements and Datatilsynet complaints
+_SETTLEMENT_URGENT_ITEMS = {
+    "pending": ("medium", _pending_settlement_item)
+}
+_COMPLAINT_URGENT_ITEMS = {
+    "submitted": ("critical", _open_complaint_item),
+    "under_review": ("critical", _open_complaint_item)
+}
+
+
+def _validate_gdpr_response(data_provided: Dict[str, Any], processing_explanation: str) -> bool:
+    """Validate completeness of GDPR response (data provided and a 100+ char explanation)"""
+    return bool(data_provided) and len(processing_explanation) >= 100
+
+
+def _activity_sort_key(value: Any) -> str:
+    """Comparable sort key for an activity date (ISO string, datetime or missing)"""
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return str(value or "")
+
+
+def _parse_iso(value: Any) -> Optional[datetime]:
+    """Parse an ISO timestamp (or pass a datetime through); None if missing or invalid"""
+
+    if not value:
+        return None
+
+    if isinstance(value, datetime):
+        return value
+
+    return _parse_iso_str(str(value))
+
+
+@lru_cache(maxsize=8192)
+def _parse_iso_str(value: str) -> Optional[datetime]:
+    # Shorter than YYYY-MM-DD cannot be an ISO date; skip the exception path
+    if len(value) < 10:
+        return None
+
+    try:
+        return datetime.fromisoformat(value.replace('Z', '+00:00'))
+    except ValueError:
+        return None
+
 
 class CreditorPortalService:
     """Service for creditor-facing portal functionality"""
 
+    # Norwegian improvement-plan action item templates
+    _TPL_RESPONSE_RATE_ACTION = "Responder på {pending} utestående GDPR-forespørsler"
+    _TPL_RESPONSE_RATE_IMPACT = "Vil øke svarrate til {response_rate}%"
+    _TPL_VIOLATIONS_ACTION = "Reduser antall overtredelser med {excess}"
+    _TPL_VIOLATIONS_IMPACT = "Må være under {max_allowed} overtredelser for {grade}-karakter"
+    _TPL_RESPONSE_TIME_ACTION = "Svar på GDPR-forespørsler innen {days} dager"
+    _TPL_RESPONSE_TIME_IMPACT = "Forbedrer gjennomsnittlig responstid"
+
     def __init__(self):
         # Access control
         self.session_duration_hours = 24
@@ -29,6 +131,39 @@ class CreditorPortalService:
             "ESCALATED": "Eskalert"
         }
 
+        # Pre-aggregated dashboard counts per creditor, kept current by apply_delta()
+        self._summary_cache: Dict[str, Dict[str, Any]] = {}
+
+    def invalidate(self, creditor_id: Optional[str] = None):
+        """Drop one creditor's pre-aggregated dashboard summary, or all of them"""
+        if creditor_id is None:
+            self._summary_cache.clear()
+        else:
+            self._summary_cache.pop(creditor_id, None)
+
+    def apply_delta(self, creditor_id: str, event: Dict[str, Any]):
+        """
+        Update a creditor's pre-aggregated summary for a write instead of recomputing it.
+
+        Events:
+        - {"type": "violation_added"}: a new (recent) violation was recorded
+        - {"type": "gdpr_request_responded"}: a pending GDPR request was answered
+        Anything else drops the summary so the next dashboard rebuilds it.
+        """
+
+        summary = self._summary_cache.get(creditor_id)
+        if summary is None:
+            return
+
+        event_type = event.get("type")
+        if event_type == "violation_added":
+            summary["violations_count"] += 1
+            summary["recent_violations"] += 1
+        elif event_type == "gdpr_request_responded":
+            summary["pending_count"] = max(summary["pending_count"] - 1, 0)
+        else:
+            self.invalidate(creditor_id)
+
     async def get_creditor_dashboard(
         self,
         creditor_id: str,
@@ -39,64 +174,59 @@ class CreditorPortalService:
         datatilsynet_complaints: List[Dict[str, Any]],
         sword_tokens: List[Dict[str, Any]],
         transparency_report: Dict[str, Any]
-    ) -> Dict[str, Any]:
+    ) -> DashboardView:
         """
         Generate comprehensive dashboard for creditor portal.
 
         Shows creditor their current compliance status and action items.
+        Returned as a slotted DashboardView that orjson serialises directly.
         """
 
+        # One clock reading for deadlines, trend windows and the generated_at stamp
+        now = datetime.now()
+
         # Calculate urgent action items
         urgent_items = self._get_urgent_action_items(
             gdpr_requests,
             settlements,
-            datatilsynet_complaints
+            datatilsynet_complaints,
+            now=now
         )
 
-        # Calculate compliance trends
-        trends = self._calculate_compliance_trends(gdpr_requests, violations)
-
-        # Get pending responses
-        pending_responses = [
-            req for req in gdpr_requests
-            if req.get("status") in ["PENDING", "SENT"]
-        ]
-
-        # Get active settlements
-        active_settlements = [
-            s for s in settlements
-            if s.get("status") in ["pending", "negotiating"]
-        ]
-
-        dashboard = {
-            "creditor": {
-                "id": creditor_id,
-                "name": creditor_data.get("name"),
-                "org_number": creditor_data.get("org_number"),
-                "type": creditor_data.get("type")
-            },
-            "compliance_summary": {
-                "grade": transparency_report.get("compliance_grade", {}).get("grade", "F"),
-                "reputation_score": transparency_report.get("reputation_score", 0),
-                "total_violations": len(violations),
-                "pending_gdpr_requests": len(pending_responses),
-                "active_settlements": len(active_settlements),
-                "datatilsynet_complaints": len(datatilsynet_complaints),
-                "sword_tokens_minted": len(sword_tokens)
-            },
-            "urgent_actions": urgent_items,
-            "trends": trends,
-            "recent_activity": self._get_recent_activity(
+        # Counts and trends come from the pre-aggregated summary when it is current
+        summary = self._get_dashboard_summary(creditor_id, gdpr_requests, violations, settlements, now)
+        trends = self._build_trends(summary["recent_violations"], summary["previous_violations"])
+
+        dashboard = DashboardView(
+            creditor=CreditorRef(
+                id=creditor_id,
+                name=creditor_data.get("name"),
+                org_number=creditor_data.get("org_number"),
+                type=creditor_data.get("type")
+            ),
+            compliance_summary=ComplianceSummary(
+                grade=transparency_report.get("compliance_grade", {}).get("grade", "F"),
+                reputation_score=transparency_report.get("reputation_score", 0),
+                total_violations=summary["violations_count"],
+                pending_gdpr_requests=summary["pending_count"],
+                active_settlements=summary["active_settlement_count"],
+                datatilsynet_complaints=len(datatilsynet_complaints),
+                sword_tokens_minted=len(sword_tokens)
+            ),
+            urgent_actions=urgent_items,
+            trends=trends,
+            recent_activity=self._get_recent_activity(
                 gdpr_requests,
                 settlements,
                 violations
             ),
-            "dashboard_generated_at": datetime.now().isoformat()
-        }
+            dashboard_generated_at=now.isoformat()
+        )
 
-        logger.info(f"📊 Creditor dashboard generated for {creditor_data.get('name')}")
-        logger.info(f"   Grade: {dashboard['compliance_summary']['grade']}")
-        logger.info(f"   Urgent actions: {len(urgent_items)}")
+        logger.info(
+            "📊 Creditor dashboard generated for %s (grade: %s, urgent actions: %d)",
+            creditor_data.get("name"), dashboard.compliance_summary.grade, len(urgent_items)
+        )
 
         return dashboard
 
@@ -122,7 +252,7 @@ class CreditorPortalService:
         additional_notes = response_data.get("notes", "")
 
         # Validate response completeness
-        is_complete = self._validate_gdpr_response(data_provided, processing_explanation)
+        is_complete = _validate_gdpr_response(data_provided, processing_explanation)
 
         response = {
             "gdpr_request_id": gdpr_request_id,
@@ -137,9 +267,10 @@ class CreditorPortalService:
             "response_status": "complete" if is_complete else "incomplete"
         }
 
-        logger.info(f"✅ GDPR response submitted by creditor {creditor_id}")
-        logger.info(f"   Request: {gdpr_request_id}")
-        logger.info(f"   Complete: {is_complete}")
+        logger.info(
+            "✅ GDPR response submitted by creditor %s (request: %s, complete: %s)",
+            creditor_id, gdpr_request_id, is_complete
+        )
 
         return response
 
@@ -173,11 +304,10 @@ class CreditorPortalService:
             "responded_at": datetime.now().isoformat()
         }
 
-        logger.info(f"💼 Settlement response from creditor {creditor_id}")
-        logger.info(f"   Settlement: {settlement_id}")
-        logger.info(f"   Action: {response_action}")
-        if counter_offer_amount:
-            logger.info(f"   Counter-offer: {counter_offer_amount} NOK")
+        logger.info(
+            "💼 Settlement response from creditor %s (settlement: %s, action: %s, counter-offer: %s NOK)",
+            creditor_id, settlement_id, response_action, counter_offer_amount
+        )
 
         return response
 
@@ -186,68 +316,50 @@ class CreditorPortalService:
         creditor_id: str,
         violations: List[Dict[str, Any]],
         filters: Optional[Dict[str, Any]] = None
-    ) -> Dict[str, Any]:
+    ) -> ViolationsView:
         """
         Show creditor all violations reported against them.
 
         Allows filtering by severity, type, date range.
         """
 
-        # Apply filters
+        # Apply filters (both in one pass; rows may omit keys, so dict.get is bound once)
         filtered_violations = violations
 
-        if filters:
-            severity_filter = filters.get("severity")
-            if severity_filter:
-                filtered_violations = [
-                    v for v in filtered_violations
-                    if v.get("severity") == severity_filter
-                ]
-
-            type_filter = filters.get("type")
-            if type_filter:
-                filtered_violations = [
-                    v for v in filtered_violations
-                    if v.get("type") == type_filter
-                ]
-
-        # Group by severity
-        by_severity = {}
-        for violation in filtered_violations:
-            severity = violation.get("severity", "unknown")
-            if severity not in by_severity:
-                by_severity[severity] = []
-            by_severity[severity].append(violation)
-
-        # Group by type
-        by_type = {}
+        severity_filter = filters.get("severity") if filters else None
+        type_filter = filters.get("type") if filters else None
+
+        if severity_filter or type_filter:
+            get = dict.get
+            filtered_violations = [
+                v for v in violations
+                if (not severity_filter or get(v, "severity") == severity_filter)
+                and (not type_filter or get(v, "type") == type_filter)
+            ]
+
+        # Count by severity and type in a single pass; the violations themselves
+        # are returned once, at the top level
+        by_severity = Counter()
+        by_type = Counter()
         for violation in filtered_violations:
-            vtype = violation.get("type", "unknown")
-            if vtype not in by_type:
-                by_type[vtype] = []
-            by_type[vtype].append(violation)
-
-        return {
-            "creditor_id": creditor_id,
-            "total_violations": len(filtered_violations),
-            "by_severity": {
-                severity: {
-                    "count": len(viols),
-                    "violations": viols
-                }
-                for severity, viols in by_severity.items()
+            by_severity[violation.get("severity", "unknown")] += 1
+            by_type[violation.get("type", "unknown")] += 1
+
+        return ViolationsView(
+            creditor_id=creditor_id,
+            total_violations=len(filtered_violations),
+            by_severity={
+                severity: {"count": count}
+                for severity, count in by_severity.items()
             },
-            "by_type": {
-                vtype: {
-                    "count": len(viols),
-                    "violations": viols
-                }
-                for vtype, viols in by_type.items()
+            by_type={
+                vtype: {"count": count}
+                for vtype, count in by_type.items()
             },
-            "violations": filtered_violations,
-            "filters_applied": filters or {},
-            "retrieved_at": datetime.now().isoformat()
-        }
+            violations=filtered_violations,
+            filters_applied=filters or {},
+            retrieved_at=datetime.now().isoformat()
+        )
 
     async def dispute_violation(
         self,
@@ -267,19 +379,21 @@ class CreditorPortalService:
         if len(dispute_reason) < 50:
             raise ValueError("Dispute reason must be at least 50 characters")
 
+        now = datetime.now()
         dispute = {
             "violation_id": violation_id,
             "creditor_id": creditor_id,
             "dispute_reason": dispute_reason,
             "evidence": evidence or {},
             "status": "under_review",
-            "submitted_at": datetime.now().isoformat(),
-            "review_deadline": (datetime.now() + timedelta(days=14)).isoformat()
+            "submitted_at": now.isoformat(),
+            "review_deadline": (now + DISPUTE_REVIEW_PERIOD).isoformat()
         }
 
-        logger.info(f"⚖️  Violation dispute submitted by creditor {creditor_id}")
-        logger.info(f"   Violation: {violation_id}")
-        logger.info(f"   Reason length: {len(dispute_reason)} chars")
+        logger.info(
+            "⚖️  Violation dispute submitted by creditor %s (violation: %s, reason length: %d chars)",
+            creditor_id, violation_id, len(dispute_reason)
+        )
 
         return dispute
 
@@ -298,14 +412,7 @@ class CreditorPortalService:
         """
 
         # Calculate what's needed for target grade
-        grade_requirements = {
-            "A": {"response_rate": 95, "avg_response_days": 15, "max_violations": 10},
-            "B": {"response_rate": 85, "avg_response_days": 20, "max_violations": 25},
-            "C": {"response_rate": 70, "avg_response_days": 25, "max_violations": 50},
-            "D": {"response_rate": 50, "avg_response_days": 30, "max_violations": 100}
-        }
-
-        target_reqs = grade_requirements.get(target_grade, {})
+        target_reqs = GRADE_REQUIREMENTS.get(target_grade, {})
 
         # Calculate current metrics
         total_requests = len(gdpr_requests)
@@ -321,8 +428,8 @@ class CreditorPortalService:
             action_items.append({
                 "category": "response_rate",
                 "priority": "high",
-                "action": f"Responder på {pending} utestående GDPR-forespørsler",
-                "impact": f"Vil øke svarrate til {target_reqs.get('response_rate')}%"
+                "action": self._TPL_RESPONSE_RATE_ACTION.format(pending=pending),
+                "impact": self._TPL_RESPONSE_RATE_IMPACT.format(response_rate=target_reqs.get("response_rate"))
             })
 
         # Violation reduction
@@ -333,23 +440,23 @@ class CreditorPortalService:
             action_items.append({
                 "category": "violations",
                 "priority": "high",
-                "action": f"Reduser antall overtredelser med {excess}",
-                "impact": f"Må være under {max_allowed} overtredelser for {target_grade}-karakter"
+                "action": self._TPL_VIOLATIONS_ACTION.format(excess=excess),
+                "impact": self._TPL_VIOLATIONS_IMPACT.format(max_allowed=max_allowed, grade=target_grade)
             })
 
         # Response time improvement
         action_items.append({
             "category": "response_time",
             "priority": "medium",
-            "action": f"Svar på GDPR-forespørsler innen {target_reqs.get('avg_response_days')} dager",
-            "impact": "Forbedrer gjennomsnittlig responstid"
+            "action": self._TPL_RESPONSE_TIME_ACTION.format(days=target_reqs.get("avg_response_days")),
+            "impact": self._TPL_RESPONSE_TIME_IMPACT
         })
 
         improvement_plan = {
             "creditor_id": creditor_id,
             "current_grade": current_grade,
             "target_grade": target_grade,
-            "requirements": target_reqs,
+            "requirements": dict(target_reqs),
             "current_metrics": {
                 "response_rate": round(current_response_rate, 1),
                 "total_violations": current_violations,
@@ -360,9 +467,10 @@ class CreditorPortalService:
             "generated_at": datetime.now().isoformat()
         }
 
-        logger.info(f"📈 Improvement plan generated for creditor {creditor_id}")
-        logger.info(f"   Current: {current_grade} → Target: {target_grade}")
-        logger.info(f"   Action items: {len(action_items)}")
+        logger.info(
+            "📈 Improvement plan generated for creditor %s (%s → %s, action items: %d)",
+            creditor_id, current_grade, target_grade, len(action_items)
+        )
 
         return improvement_plan
 
@@ -383,22 +491,23 @@ class CreditorPortalService:
 
         # Generate secure token
         token = secrets.token_urlsafe(32)
-        expires_at = datetime.now() + timedelta(hours=self.session_duration_hours)
+        issued_at = datetime.now()
+        expires_at = issued_at + timedelta(hours=self.session_duration_hours)
 
-        # Hash token for storage
-        token_hash = hashlib.sha256(token.encode()).hexdigest()
+        # Hash token for storage lookup (token_urlsafe output is ASCII)
+        token_hash = hashlib.blake2b(token.encode("ascii"), digest_size=32).hexdigest()
 
         access_token = {
             "token": token,
             "token_hash": token_hash,
             "creditor_id": creditor_id,
             "creditor_email": creditor_email,
-            "issued_at": datetime.now().isoformat(),
+            "issued_at": issued_at.isoformat(),
             "expires_at": expires_at.isoformat(),
             "session_duration_hours": self.session_duration_hours
         }
 
-        logger.info(f"🔑 Access token generated for creditor {creditor_id}")
+        logger.info("🔑 Access token generated for creditor %s", creditor_id)
 
         return access_token
 
@@ -406,93 +515,142 @@ class CreditorPortalService:
         self,
         gdpr_requests: List[Dict[str, Any]],
         settlements: List[Dict[str, Any]],
-        datatilsynet_complaints: List[Dict[str, Any]]
+        datatilsynet_complaints: List[Dict[str, Any]],
+        now: Optional[datetime] = None
     ) -> List[Dict[str, Any]]:
         """Identify urgent action items requiring immediate attention"""
 
-        urgent_items = []
+        # Items are bucketed by priority as they are found, most urgent bucket first
+        critical_items = []
+        high_items = []
+        medium_items = []
+        buckets = {"critical": critical_items, "high": high_items, "medium": medium_items}
 
         # Overdue GDPR requests
-        now = datetime.now()
+        now = now or datetime.now()
         for request in gdpr_requests:
             if request.get("status") == "PENDING":
                 deadline = request.get("response_due")
-                if deadline:
-                    try:
-                        deadline_dt = datetime.fromisoformat(str(deadline).replace('Z', '+00:00'))
-                        days_remaining = (deadline_dt - now).days
-
-                        if days_remaining < 0:
-                            urgent_items.append({
-                                "type": "overdue_gdpr_request",
-                                "priority": "critical",
-                                "message": f"GDPR-forespørsel {days_remaining * -1} dager forsinket",
-                                "request_id": request.get("id"),
-                                "deadline": deadline
-                            })
-                        elif days_remaining <= 5:
-                            urgent_items.append({
-                                "type": "expiring_gdpr_request",
-                                "priority": "high",
-                                "message": f"GDPR-forespørsel forfaller om {days_remaining} dager",
-                                "request_id": request.get("id"),
-                                "deadline": deadline
-                            })
-                    except:
-                        pass
-
-        # Pending settlement responses
-        for settlement in settlements:
-            if settlement.get("status") == "pending":
-                urgent_items.append({
-                    "type": "pending_settlement",
-                    "priority": "medium",
-                    "message": "Forlikstilbud venter på svar",
-                    "settlement_id": settlement.get("id"),
-                    "amount": settlement.get("settlement_amount")
-                })
-
-        # Datatilsynet complaints
-        for complaint in datatilsynet_complaints:
-            if complaint.get("status") in ["submitted", "under_review"]:
-                urgent_items.append({
-                    "type": "datatilsynet_complaint",
-                    "priority": "critical",
-                    "message": "Klage til Datatilsynet under behandling",
-                    "complaint_id": complaint.get("id"),
-                    "estimated_fine": complaint.get("estimated_fine")
-                })
-
-        # Sort by priority
-        priority_order = {"critical": 0, "high": 1, "medium": 2, "low": 3}
-        urgent_items.sort(key=lambda x: priority_order.get(x.get("priority", "low"), 3))
-
-        return urgent_items
+                deadline_dt = _parse_iso(deadline)
+                if deadline_dt is None:
+                    continue
+
+                try:
+                    days_remaining = (deadline_dt - now).days
+                except TypeError:
+                    # Timezone-aware vs naive timestamps cannot be subtracted
+                    continue
+
+                if days_remaining < 0:
+                    critical_items.append({
+                        "type": "overdue_gdpr_request",
+                        "priority": "critical",
+                        "message": f"GDPR-forespørsel {days_remaining * -1} dager forsinket",
+                        "request_id": request.get("id"),
+                        "deadline": deadline
+                    })
+                elif days_remaining <= 5:
+                    high_items.append({
+                        "type": "expiring_gdpr_request",
+                        "priority": "high",
+                        "message": f"GDPR-forespørsel forfaller om {days_remaining} dager",
+                        "request_id": request.get("id"),
+                        "deadline": deadline
+                    })
+
+        # Pending settlement responses and open Datatilsynet complaints (table-driven by status)
+        for records, urgent_by_status in (
+            (settlements, _SETTLEMENT_URGENT_ITEMS),
+            (datatilsynet_complaints, _COMPLAINT_URGENT_ITEMS)
+        ):
+            for record in records:
+                urgent = urgent_by_status.get(record.get("status"))
+                if urgent:
+                    priority, build_item = urgent
+                    buckets[priority].append(build_item(record))
+
+        return critical_items + high_items + medium_items
 
     def _calculate_compliance_trends(
         self,
         gdpr_requests: List[Dict[str, Any]],
-        violations: List[Dict[str, Any]]
+        violations: List[Dict[str, Any]],
+        now: Optional[datetime] = None
     ) -> Dict[str, Any]:
         """Calculate compliance trends over time"""
 
-        # Simple trend: last 30 days vs previous 30 days
-        now = datetime.now()
-        thirty_days_ago = now - timedelta(days=30)
-        sixty_days_ago = now - timedelta(days=60)
+        recent_violations, previous_violations = self._count_violation_periods(
+            violations,
+            now or datetime.now()
+        )
+
+        return self._build_trends(recent_violations, previous_violations)
+
+    def _get_dashboard_summary(
+        self,
+        creditor_id: str,
+        gdpr_requests: List[Dict[str, Any]],
+        violations: List[Dict[str, Any]],
+        settlements: List[Dict[str, Any]],
+        now: datetime
+    ) -> Dict[str, Any]:
+        """Return the creditor's pre-aggregated dashboard counts, rebuilding them when stale"""
+
+        summary = self._summary_cache.get(creditor_id)
+        if (
+            summary is not None
+            and summary["violations_count"] == len(violations)
+            and now - summary["computed_at"] < DASHBOARD_SUMMARY_MAX_AGE
+        ):
+            return summary
+
+        recent_violations, previous_violations = self._count_violation_periods(violations, now)
+
+        summary = {
+            "violations_count": len(violations),
+            "pending_count": sum(1 for req in gdpr_requests if req.get("status") in _PENDING_STATUSES),
+            "active_settlement_count": sum(
+                1 for s in settlements if s.get("status") in _ACTIVE_SETTLEMENT_STATUSES
+            ),
+            "recent_violations": recent_violations,
+            "previous_violations": previous_violations,
+            "computed_at": now
+        }
 
-        # Recent violations
-        recent_violations = len([
-            v for v in violations
-            if self._is_date_in_range(v.get("detected_at"), thirty_days_ago, now)
-        ])
+        self._summary_cache[creditor_id] = summary
+        return summary
 
-        # Previous period violations
-        previous_violations = len([
-            v for v in violations
-            if self._is_date_in_range(v.get("detected_at"), sixty_days_ago, thirty_days_ago)
-        ])
+    @staticmethod
+    def _count_violation_periods(
+        violations: List[Dict[str, Any]],
+        now: datetime
+    ) -> Tuple[int, int]:
+        """Count violations detected in the last 30 days and in the 30 days before that"""
 
+        # Simple trend: last 30 days vs previous 30 days
+        thirty_days_ago = now - TREND_WINDOW
+        sixty_days_ago = thirty_days_ago - TREND_WINDOW
+
+        # Count recent and previous period violations in a single pass
+        recent_violations = previous_violations = 0
+        for violation in violations:
+            detected = _parse_iso(violation.get("detected_at"))
+            if detected is None:
+                continue
+
+            try:
+                if thirty_days_ago <= detected <= now:
+                    recent_violations += 1
+                elif sixty_days_ago <= detected < thirty_days_ago:
+                    previous_violations += 1
+            except TypeError:
+                # Timezone-aware vs naive timestamps are not comparable
+                continue
+
+        return recent_violations, previous_violations
+
+    @staticmethod
+    def _build_trends(recent_violations: int, previous_violations: int) -> Dict[str, Any]:
         # Calculate trend
         trend = "improving" if recent_violations < previous_violations else "worsening"
         if recent_violations == previous_violations:
@@ -503,73 +661,66 @@ class CreditorPortalService:
             "recent_violations": recent_violations,
             "previous_violations": previous_violations,
             "trend": trend,
-            "change_percentage": self._calculate_percentage_change(previous_violations, recent_violations)
+            "change_percentage": CreditorPortalService._calculate_percentage_change(previous_violations, recent_violations)
         }
 
+    @staticmethod
     def _get_recent_activity(
-        self,
         gdpr_requests: List[Dict[str, Any]],
         settlements: List[Dict[str, Any]],
         violations: List[Dict[str, Any]]
     ) -> List[Dict[str, Any]]:
         """Get recent activity log"""
 
-        activity = []
-
-        # Recent GDPR requests
-        for req in gdpr_requests[:5]:
-            activity.append({
+        # Five most recent GDPR requests and violations, each newest first
+        recent_requests = (
+            {
                 "type": "gdpr_request",
                 "date": req.get("sent_at"),
                 "description": f"GDPR-forespørsel mottatt - Status: {req.get('status')}"
-            })
+            }
+            for req in heapq.nlargest(5, gdpr_requests, key=lambda r: _activity_sort_key(r.get("sent_at")))
+        )
 
-        # Recent violations
-        for viol in violations[:5]:
-            activity.append({
+        recent_violations = (
+            {
                 "type": "violation",
                 "date": viol.get("detected_at"),
                 "description": f"Overtredelse registrert: {viol.get('type')} ({viol.get('severity')})"
-            })
-
-        # Sort by date (most recent first)
-        activity.sort(key=lambda x: x.get("date", ""), reverse=True)
-
-        return activity[:10]  # Return top 10 most recent
-
-    def _validate_gdpr_response(
-        self,
-        data_provided: Dict[str, Any],
-        processing_explanation: str
-    ) -> bool:
-        """Validate completeness of GDPR response"""
-
-        if not data_provided:
-            return False
+            }
+            for viol in heapq.nlargest(5, violations, key=lambda v: _activity_sort_key(v.get("detected_at")))
+        )
 
-        if len(processing_explanation) < 100:
-            return False
+        # Merge by date (most recent first) and return top 10 most recent
+        merged = heapq.merge(
+            recent_requests,
+            recent_violations,
+            key=lambda item: _activity_sort_key(item["date"]),
+            reverse=True
+        )
 
-        return True
+        return list(islice(merged, 10))
 
+    @staticmethod
     def _is_date_in_range(
-        self,
-        date_str: Optional[str],
+        date_value: Any,
         start: datetime,
         end: datetime
     ) -> bool:
-        """Check if date falls within range"""
+        """Check if date (ISO string or datetime) falls within range"""
 
-        if not date_str:
+        date = _parse_iso(date_value)
+        if date is None:
             return False
 
         try:
-            date = datetime.fromisoformat(str(date_str).replace('Z', '+00:00'))
             return start <= date <= end
-        except:
+        except TypeError:
+            # Timezone-aware vs naive timestamps are not comparable
             return False
 
-    def _calculate_percentage_change(self, old_value: float, new_value: float) -> float:
+    @staticmethod
+    def _calculate_percentage_change(old_value: float, new_value: float) -> float:
         """Calculate percentage change between two values"""
 
         if old_value == 0:
@@ -20,9 +20,59 @@ Complaint Types:
 5. data_breach - Failure to notify data breach
 """
 
-from typing import Dict, List, Any, Optional
-from datetime import datetime, timedelta
-import re
+from typing import Dict, List, Any, NamedTuple, Optional, Set
+from collections import Counter
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from types import MappingProxyType
+
+# Violation types mapped to Norwegian descriptions for the complaint letter
+_TYPE_DESCRIPTIONS_NO = MappingProxyType({
+    'delayed_response': 'Manglende respons innen lovpålagt frist',
+    'incomplete_response': 'Ufullstendig eller mangelfull respons',
+    'refusal_to_comply': 'Eksplisitt avslag på å etterkomme forespørsel',
+    'excessive_fees': 'Ulovlig gebyr for GDPR-forespørsel',
+    'data_breach': 'Manglende varsling om databrudd'
+})
+
+# Fine multiplier per violation severity (GDPR Article 83 estimate)
+_SEVERITY_MULTIPLIERS = MappingProxyType({
+    "low": 1.0,
+    "medium": 2.0,
+    "high": 4.0,
+    "critical": 8.0
+})
+
+# Severities from most to least serious, for picking the overall severity
+_SEVERITY_ORDER = ("critical", "high", "medium", "low")
+
+# Severity -> integer rank (unknown severities rank with "low")
+_SEVERITIES_BY_RANK = ("low", "medium", "high", "critical")
+_SEVERITY_RANK = MappingProxyType({sev: rank for rank, sev in enumerate(_SEVERITIES_BY_RANK)})
+
+_NORWEGIAN_DATE_FORMAT = "%d.%m.%Y"
+
+
+@lru_cache(maxsize=1024)
+def _parse_iso(date_str: str) -> datetime:
+    """Parse an ISO timestamp; the same sentAt/responseDue values recur within a complaint"""
+    # Python 3.11+ fromisoformat accepts the trailing 'Z' natively
+    return datetime.fromisoformat(date_str)
+
+
+class _ViolationSummary(NamedTuple):
+    """Per-complaint violation aggregates shared by the evidence package and legal analysis"""
+    evidence: List[Dict[str, Any]]
+    severity_counts: Counter
+    legal_references: Set[str]
+    total_damages: float
+
+
+def _now_matching(dt: datetime, now_utc: datetime) -> datetime:
+    """Express the shared 'now' in dt's timezone, or as naive local time when dt is naive"""
+    if dt.tzinfo is None:
+        return now_utc.astimezone().replace(tzinfo=None)
+    return now_utc.astimezone(dt.tzinfo)
 
 
 class DatatilsynetService:
@@ -75,15 +125,21 @@ class DatatilsynetService:
             Complaint package with formal letter and evidence
         """
 
+        # One clock read shared by every timestamp in the complaint
+        now_utc = datetime.now(timezone.utc)
+        now_local = now_utc.astimezone().replace(tzinfo=None)
+
         # Build complaint components
-        complaint_reference = self._generate_complaint_reference(gdpr_request)
+        complaint_reference = self._generate_complaint_reference(gdpr_request, now_local)
         complaint_letter = self._build_formal_complaint_letter(
-            user_data, creditor_data, gdpr_request, violations
+            user_data, creditor_data, gdpr_request, violations, now_local
         )
+        # One pass over violations feeds both the evidence package and the legal analysis
+        summary = self._summarize_violations(violations)
         evidence_package = self._build_evidence_package(
-            gdpr_request, violations
+            gdpr_request, violations, now_utc, summary
         )
-        legal_analysis = self._build_legal_analysis(violations)
+        legal_analysis = self._build_legal_analysis(violations, summary)
         recommended_actions = self._recommend_enforcement_actions(
             creditor_data, violations
         )
@@ -106,22 +162,23 @@ class DatatilsynetService:
                 "address": self.datatilsynet_address,
                 "phone": self.datatilsynet_phone
             },
-            "created_at": datetime.now().isoformat(),
+            "created_at": now_local.isoformat(),
             "status": "draft"
         }
 
-    def _generate_complaint_reference(self, gdpr_request: Dict) -> str:
+    def _generate_complaint_reference(self, gdpr_request: Dict, now: Optional[datetime] = None) -> str:
         """Generate unique complaint reference number"""
-        date_str = datetime.now().strftime("%Y%m%d")
+        today = now or datetime.now()
         request_id = gdpr_request.get('referenceId', 'UNKNOWN')
-        return f"DT-COMPLAINT-{date_str}-{request_id}"
+        return f"DT-COMPLAINT-{today.year}{today.month:02d}{today.day:02d}-{request_id}"
 
     def _build_formal_complaint_letter(
         self,
         user_data: Dict,
         creditor_data: Dict,
         gdpr_request: Dict,
-        violations: List[Dict]
+        violations: List[Dict],
+        now: Optional[datetime] = None
     ) -> str:
         """
         Build formal complaint letter in Norwegian for Datatilsynet
@@ -143,7 +200,7 @@ class DatatilsynetService:
         # Format dates
         sent_date_formatted = self._format_norwegian_date(sent_date)
         deadline_formatted = self._format_norwegian_date(deadline_date)
-        today = datetime.now().strftime("%d.%m.%Y")
+        today = (now or datetime.now()).strftime(_NORWEGIAN_DATE_FORMAT)
 
         # Build violations section
         violations_text = self._format_violations_for_letter(violations)
@@ -293,11 +350,12 @@ faktiske hendelser.
         """Format ISO date to Norwegian format (DD.MM.YYYY)"""
         if not date_str:
             return "dato ikke oppgitt"
+        if not isinstance(date_str, str):
+            return date_str
 
         try:
-            dt = datetime.fromisoformat(date_str.replace('Z', '+00:00'))
-            return dt.strftime("%d.%m.%Y")
-        except:
+            return _parse_iso(date_str).strftime(_NORWEGIAN_DATE_FORMAT)
+        except ValueError:
             return date_str
 
     def _format_violations_for_letter(self, violations: List[Dict]) -> str:
@@ -314,15 +372,7 @@ faktiske hendelser.
             legal_ref = violation.get('legalReference', '')
 
             # Map violation type to Norwegian description
-            type_descriptions = {
-                'delayed_response': 'Manglende respons innen lovpålagt frist',
-                'incomplete_response': 'Ufullstendig eller mangelfull respons',
-                'refusal_to_comply': 'Eksplisitt avslag på å etterkomme forespørsel',
-                'excessive_fees': 'Ulovlig gebyr for GDPR-forespørsel',
-                'data_breach': 'Manglende varsling om databrudd'
-            }
-
-            description = type_descriptions.get(v_type, 'Ukjent overtredelse')
+            description = _TYPE_DESCRIPTIONS_NO.get(v_type, 'Ukjent overtredelse')
             severity_no = self.severity_mapping.get(severity, severity)
 
             formatted.append(
@@ -337,33 +387,28 @@ faktiske hendelser.
     def _build_evidence_package(
         self,
         gdpr_request: Dict,
-        violations: List[Dict]
+        violations: List[Dict],
+        now_utc: Optional[datetime] = None,
+        summary: Optional[_ViolationSummary] = None
     ) -> Dict[str, Any]:
         """Build comprehensive evidence package"""
 
+        now_utc = now_utc or datetime.now(timezone.utc)
+        summary = summary or self._summarize_violations(violations)
+
         return {
             "gdpr_request": {
                 "reference_id": gdpr_request.get('referenceId'),
                 "sent_at": gdpr_request.get('sentAt'),
                 "deadline": gdpr_request.get('responseDue'),
                 "days_overdue": self._calculate_days_overdue(
-                    gdpr_request.get('responseDue')
+                    gdpr_request.get('responseDue'), now_utc
                 ),
                 "delivery_proof": "E-mail delivery confirmation available",
                 "tracking_pixel": gdpr_request.get('trackingPixelViewed', False)
             },
-            "violations": [
-                {
-                    "type": v.get('type'),
-                    "severity": v.get('severity'),
-                    "legal_reference": v.get('legalReference'),
-                    "evidence": v.get('evidence'),
-                    "confidence": v.get('confidence'),
-                    "estimated_damage": v.get('estimatedDamage', 0)
-                }
-                for v in violations
-            ],
-            "timeline": self._build_timeline(gdpr_request),
+            "violations": summary.evidence,
+            "timeline": self._build_timeline(gdpr_request, now_utc),
             "communication_log": [
                 {
                     "date": gdpr_request.get('sentAt'),
@@ -380,20 +425,20 @@ faktiske hendelser.
             ]
         }
 
-    def _calculate_days_overdue(self, deadline_str: str) -> int:
+    def _calculate_days_overdue(self, deadline_str: str, now_utc: Optional[datetime] = None) -> int:
         """Calculate how many days overdue the response is"""
-        if not deadline_str:
+        if not deadline_str or not isinstance(deadline_str, str):
             return 0
 
         try:
-            deadline = datetime.fromisoformat(deadline_str.replace('Z', '+00:00'))
-            now = datetime.now(deadline.tzinfo)
-            delta = (now - deadline).days
-            return max(0, delta)
-        except:
+            deadline = _parse_iso(deadline_str)
+        except ValueError:
             return 0
 
-    def _build_timeline(self, gdpr_request: Dict) -> List[Dict]:
+        now = _now_matching(deadline, now_utc or datetime.now(timezone.utc))
+        return max(0, (now - deadline).days)
+
+    def _build_timeline(self, gdpr_request: Dict, now_utc: Optional[datetime] = None) -> List[Dict]:
         """Build timeline of events"""
         timeline = []
 
@@ -416,57 +461,68 @@ faktiske hendelser.
             })
 
         # Calculate current day
-        if sent_at:
+        if sent_at and isinstance(sent_at, str):
             try:
-                sent_date = datetime.fromisoformat(sent_at.replace('Z', '+00:00'))
-                now = datetime.now(sent_date.tzinfo)
-                current_day = (now - sent_date).days
+                sent_date = _parse_iso(sent_at)
+            except ValueError:
+                sent_date = None
 
+            if sent_date is not None:
+                now = _now_matching(sent_date, now_utc or datetime.now(timezone.utc))
                 timeline.append({
-                    "day": current_day,
+                    "day": (now - sent_date).days,
                     "date": now.isoformat(),
                     "event": "Complaint filed with Datatilsynet",
                     "status": "current"
                 })
-            except:
-                pass
 
         return timeline
 
-    def _build_legal_analysis(self, violations: List[Dict]) -> Dict[str, Any]:
-        """Build legal analysis of violations"""
-
-        total_violations = len(violations)
-        severity_counts = {}
+    def _summarize_violations(self, violations: List[Dict]) -> _ViolationSummary:
+        """Build evidence entries and severity/reference/damage aggregates in a single pass"""
+        evidence = []
+        severity_counts = Counter()
         legal_references = set()
         total_damages = 0
 
-        for violation in violations:
-            # Count by severity
-            severity = violation.get('severity', 'unknown')
-            severity_counts[severity] = severity_counts.get(severity, 0) + 1
-
-            # Collect legal references
-            legal_ref = violation.get('legalReference', '')
+        for v in violations:
+            legal_ref = v.get('legalReference')
+            damage = v.get('estimatedDamage', 0)
+
+            evidence.append({
+                "type": v.get('type'),
+                "severity": v.get('severity'),
+                "legal_reference": legal_ref,
+                "evidence": v.get('evidence'),
+                "confidence": v.get('confidence'),
+                "estimated_damage": damage
+            })
+            severity_counts[v.get('severity', 'unknown')] += 1
             if legal_ref:
                 legal_references.add(legal_ref)
+            total_damages += damage
 
-            # Sum damages
-            total_damages += violation.get('estimatedDamage', 0)
+        return _ViolationSummary(evidence, severity_counts, legal_references, total_damages)
+
+    def _build_legal_analysis(
+        self,
+        violations: List[Dict],
+        summary: Optional[_ViolationSummary] = None
+    ) -> Dict[str, Any]:
+        """Build legal analysis of violations"""
+
+        summary = summary or self._summarize_violations(violations)
+        total_violations = len(violations)
+        severity_counts = summary.severity_counts
+        legal_references = summary.legal_references
+        total_damages = summary.total_damages
 
         # Determine overall severity
-        if 'critical' in severity_counts:
-            overall_severity = "critical"
-        elif 'high' in severity_counts:
-            overall_severity = "high"
-        elif 'medium' in severity_counts:
-            overall_severity = "medium"
-        else:
-            overall_severity = "low"
+        overall_severity = next((s for s in _SEVERITY_ORDER if s in severity_counts), "low")
 
         return {
             "total_violations": total_violations,
-            "severity_breakdown": severity_counts,
+            "severity_breakdown": dict(severity_counts),
             "overall_severity": overall_severity,
             "legal_references": list(legal_references),
             "total_estimated_damages": total_damages,
@@ -489,12 +545,9 @@ faktiske hendelser.
         )
 
         # Check severity
-        severity_counts = {}
-        for v in violations:
-            sev = v.get('severity', 'low')
-            severity_counts[sev] = severity_counts.get(sev, 0) + 1
+        severity_counts = Counter(v.get('severity', 'low') for v in violations)
 
-        if severity_counts.get('critical', 0) > 0 or severity_counts.get('high', 0) > 1:
+        if severity_counts['critical'] > 0 or severity_counts['high'] > 1:
             actions.append(
                 "Vurdere administrative sanksjoner (bøter) i henhold til GDPR art. 83"
             )
@@ -545,20 +598,10 @@ faktiske hendelser.
         base_fine = 50000  # NOK (starting point)
 
         # Factor 1: Severity multiplier
-        severity_multipliers = {
-            "low": 1.0,
-            "medium": 2.0,
-            "high": 4.0,
-            "critical": 8.0
-        }
-
-        max_severity = "low"
-        for v in violations:
-            sev = v.get('severity', 'low')
-            if severity_multipliers.get(sev, 0) > severity_multipliers.get(max_severity, 0):
-                max_severity = sev
+        max_rank = max((_SEVERITY_RANK.get(v.get('severity', 'low'), 0) for v in violations), default=0)
+        max_severity = _SEVERITIES_BY_RANK[max_rank]
 
-        severity_multiplier = severity_multipliers.get(max_severity, 1.0)
+        severity_multiplier = _SEVERITY_MULTIPLIERS.get(max_severity, 1.0)
 
         # Factor 2: Number of violations
         num_violations = len(violations)
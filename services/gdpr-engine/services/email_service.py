@@ -1,10 +1,52 @@
 import os
+import asyncio
 import logging
-from typing import Optional, Dict, Any
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
 import aiohttp
+import orjson
 
 logger = logging.getLogger(__name__)
 
+# Queued notification sends before submit() applies back-pressure
+EMAIL_BUFFER_MAX_SIZE = 200
+
+
+class EmailBuffer:
+    """Fire-and-forget send queue: submit() returns once enqueued, a background task sends"""
+
+    def __init__(self, max_size: int = EMAIL_BUFFER_MAX_SIZE):
+        self._queue: asyncio.Queue[Tuple[Callable[..., Awaitable[Any]], tuple, dict]] = asyncio.Queue(maxsize=max_size)
+        self._drainer: Optional[asyncio.Task] = None
+
+    async def submit(self, send: Callable[..., Awaitable[Any]], *args, **kwargs):
+        """Queue a send coroutine function; waits only while the queue is full"""
+        if self._drainer is None or self._drainer.done():
+            self._drainer = asyncio.create_task(self._drain())
+        await self._queue.put((send, args, kwargs))
+
+    async def flush(self):
+        """Wait until every queued send has been attempted"""
+        if self._drainer is not None and not self._drainer.done():
+            await self._queue.join()
+
+    async def close(self):
+        """Flush outstanding sends and stop the background drainer"""
+        await self.flush()
+        if self._drainer is not None:
+            self._drainer.cancel()
+            self._drainer = None
+
+    async def _drain(self):
+        while True:
+            send, args, kwargs = await self._queue.get()
+            try:
+                await send(*args, **kwargs)
+            except Exception as e:
+                logger.error(f"❌ Buffered email send failed ({getattr(send, '__name__', send)}): {e}")
+            finally:
+                self._queue.task_done()
+
+
 class EmailService:
     def __init__(self):
         # SendGrid configuration
@@ -15,7 +57,60 @@ class EmailService:
 
         # Development mode check
         self.is_dev_mode = not self.sendgrid_api_key or self.sendgrid_api_key == "your_sendgrid_api_key_here"
-        
+
+        # SendGrid auth headers, built once and reused for every send
+        self._headers = {
+            "Authorization": f"Bearer {self.sendgrid_api_key}",
+            "Content-Type": "application/json"
+        }
+
+        # SendGrid payload fields that never change between sends
+        self._payload_base = {
+            "from": {
+                "email": self.from_email,
+                "name": self.from_name
+            },
+            "tracking_settings": {
+                "click_tracking": {"enable": True},
+                "open_tracking": {"enable": True}
+            }
+        }
+
+        # Shared HTTP session (keep-alive + DNS cache), created lazily on first use
+        self._session: Optional[aiohttp.ClientSession] = None
+
+        # Notification/reminder sends that callers should not wait on
+        self.buffered = EmailBuffer()
+
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Return the pooled SendGrid session, creating it on first use"""
+        # Keep-alive + DNS cache mean a warm session skips the lookup and TLS handshake per send.
+        # If sends ever become TLS-bound, httpx.AsyncClient(http2=True) would multiplex them over
+        # one connection (as CardanoClient does for Blockfrost).
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=64,
+                    limit_per_host=32,
+                    keepalive_timeout=75,
+                    ttl_dns_cache=300,
+                    enable_cleanup_closed=True
+                ),
+                timeout=aiohttp.ClientTimeout(total=15, connect=3)
+            )
+        return self._session
+
+    async def flush(self):
+        """Wait for buffered notification sends to go out"""
+        await self.buffered.flush()
+
+    async def close(self):
+        """Flush buffered sends, then close the pooled SendGrid session"""
+        await self.buffered.close()
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
     async def send_gdpr_request_email(
         self,
         to_email: str,
@@ -64,13 +159,10 @@ class EmailService:
                 "request_type": "gdpr_article_15"
             }
 
-            # SendGrid API payload
+            # SendGrid API payload (static fields come from the prebuilt base)
             payload = {
+                **self._payload_base,
                 "personalizations": personalizations,
-                "from": {
-                    "email": self.from_email,
-                    "name": self.from_name
-                },
                 "reply_to": {
                     "email": f"gdpr+{tracking_id}@damocles.no",
                     "name": "DAMOCLES GDPR Response"
@@ -82,41 +174,32 @@ class EmailService:
                         "value": content
                     }
                 ],
-                "custom_args": custom_args,
-                "tracking_settings": {
-                    "click_tracking": {"enable": True},
-                    "open_tracking": {"enable": True}
-                }
+                "custom_args": custom_args
             }
 
-            # Send via SendGrid API
-            headers = {
-                "Authorization": f"Bearer {self.sendgrid_api_key}",
-                "Content-Type": "application/json"
-            }
+            # Send via SendGrid API (pooled session reuses the TLS connection)
+            session = await self._get_session()
+            async with session.post(
+                self.sendgrid_api_url,
+                data=orjson.dumps(payload),
+                headers=self._headers
+            ) as response:
+                if response.status == 202:
+                    response_data = await response.text()
+                    logger.info(f"✅ GDPR email sent via SendGrid to {to_email}")
 
-            async with aiohttp.ClientSession() as session:
-                async with session.post(
-                    self.sendgrid_api_url,
-                    json=payload,
-                    headers=headers
-                ) as response:
-                    if response.status == 202:
-                        response_data = await response.text()
-                        logger.info(f"✅ GDPR email sent via SendGrid to {to_email}")
-
-                        return {
-                            "status": "sent",
-                            "message_id": f"sendgrid-{tracking_id}",
-                            "recipients": [to_email] + (cc_emails or [])
-                        }
-                    else:
-                        error_text = await response.text()
-                        logger.error(f"❌ SendGrid API error ({response.status}): {error_text}")
-                        return {
-                            "status": "failed",
-                            "error": f"SendGrid returned {response.status}: {error_text}"
-                        }
+                    return {
+                        "status": "sent",
+                        "message_id": f"sendgrid-{tracking_id}",
+                        "recipients": [to_email] + (cc_emails or [])
+                    }
+                else:
+                    error_text = await response.text()
+                    logger.error(f"❌ SendGrid API error ({response.status}): {error_text}")
+                    return {
+                        "status": "failed",
+                        "error": f"SendGrid returned {response.status}: {error_text}"
+                    }
 
         except Exception as e:
             logger.error(f"❌ Failed to send GDPR email: {e}")
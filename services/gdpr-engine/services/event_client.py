@@ -1,6 +1,6 @@
 import aiohttp
-import json
 import logging
+import orjson
 from typing import Dict, Any, Optional
 from datetime import datetime
 
@@ -9,9 +9,38 @@ logger = logging.getLogger(__name__)
 class EventClient:
     """Client for recording events in the user-service event store"""
 
-    def __init__(self, user_service_url: str = "http://localhost:3001"):
+    def __init__(
+        self,
+        user_service_url: str = "http://localhost:3001",
+        pool_size: int = 100,
+        limit_per_host: int = 32
+    ):
         self.base_url = user_service_url
         self.api_base = f"{self.base_url}/api/events"
+        self.pool_size = pool_size
+        self.limit_per_host = limit_per_host
+
+        # Shared HTTP session (keep-alive), created lazily on first use
+        self._session: Optional[aiohttp.ClientSession] = None
+
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Return the pooled client session, creating it on first use"""
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=self.pool_size,
+                    limit_per_host=self.limit_per_host,
+                    keepalive_timeout=60
+                ),
+                timeout=aiohttp.ClientTimeout(total=10)
+            )
+        return self._session
+
+    async def close(self):
+        """Close the pooled client session"""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
 
     async def record_gdpr_event(
         self,
@@ -30,22 +59,22 @@ class EventClient:
         }
 
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.post(
-                    f"{self.api_base}/gdpr",
-                    json=payload,
-                    headers={"Content-Type": "application/json"}
-                ) as response:
-
-                    if response.status == 200:
-                        result = await response.json()
-                        event_id = result.get('eventId')
-                        logger.info(f"✅ GDPR event recorded successfully: {event_id}")
-                        return event_id
-                    else:
-                        error_text = await response.text()
-                        logger.error(f"❌ Failed to record GDPR event: {response.status} - {error_text}")
-                        return None
+            session = await self._get_session()
+            async with session.post(
+                f"{self.api_base}/gdpr",
+                data=orjson.dumps(payload),
+                headers={"Content-Type": "application/json"}
+            ) as response:
+
+                if response.status == 200:
+                    result = await response.json()
+                    event_id = result.get('eventId')
+                    logger.info(f"✅ GDPR event recorded successfully: {event_id}")
+                    return event_id
+                else:
+                    error_text = await response.text()
+                    logger.error(f"❌ Failed to record GDPR event: {response.status} - {error_text}")
+                    return None
 
         except Exception as e:
             logger.error(f"❌ Error recording GDPR event: {str(e)}")
@@ -208,17 +237,17 @@ class EventClient:
         """Check if event service is healthy"""
 
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(
-                    f"{self.api_base}/health",
-                    timeout=aiohttp.ClientTimeout(total=5)
-                ) as response:
-
-                    if response.status == 200:
-                        result = await response.json()
-                        return result.get("status") == "healthy"
-                    else:
-                        return False
+            session = await self._get_session()
+            async with session.get(
+                f"{self.api_base}/health",
+                timeout=aiohttp.ClientTimeout(total=5)
+            ) as response:
+
+                if response.status == 200:
+                    result = await response.json()
+                    return result.get("status") == "healthy"
+                else:
+                    return False
 
         except Exception as e:
             logger.error(f"❌ Event service health check failed: {str(e)}")
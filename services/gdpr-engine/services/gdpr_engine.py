@@ -1,9 +1,13 @@
 import asyncio
+import base64
+import hashlib
+import secrets
 import uuid
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Any
 from jinja2 import Environment, FileSystemLoader, Template
 import aiohttp
+import orjson
 from email.mime.multipart import MIMEMultipart
 from email.mime.text import MIMEText
 import logging
@@ -17,12 +21,19 @@ from services.blockchain_client import BlockchainClient
 from services.event_client import EventClient
 from services.template_selector import TemplateSelector
 from services.datatilsynet_service import DatatilsynetService
+from services.transparency_service import TransparencyService
+from services.compliance_snapshot_service import ComplianceSnapshotService
 from database import Database
 
 logger = logging.getLogger(__name__)
 
 class GDPREngine:
-    def __init__(self, database: Database):
+    def __init__(
+        self,
+        database: Database,
+        *,
+        compliance_snapshots: Optional[ComplianceSnapshotService] = None
+    ):
         self.db = database
         self.email_service = EmailService()
         self.violation_detector = ViolationDetector()
@@ -31,12 +42,26 @@ class GDPREngine:
         self.template_selector = TemplateSelector()
         self.datatilsynet_service = DatatilsynetService()
 
-        # Initialize Jinja2 environment
+        # Share the API's snapshot service when given so refreshes also invalidate its caches
+        self.compliance_snapshots = compliance_snapshots or ComplianceSnapshotService(database, TransparencyService())
+
+        # Initialize Jinja2 environment (templates ship with the image, so skip mtime checks)
         self.template_env = Environment(
             loader=FileSystemLoader('templates'),
-            autoescape=True
+            autoescape=True,
+            auto_reload=False,
+            cache_size=-1
         )
 
+        # Compile every request template once up front; unknown names are compiled on first use
+        self._compiled_templates: Dict[str, Template] = {
+            name: self.template_env.get_template(name)
+            for name in self.template_env.list_templates(extensions=('html',))
+        }
+
+        # Short per-creditor tags used in reference IDs
+        self._creditor_tags: Dict[str, str] = {}
+
         # Legacy GDPR request templates (for fallback)
         self.legacy_templates = {
             'inkasso': 'gdpr_inkasso.html',
@@ -45,6 +70,20 @@ class GDPREngine:
             'default': 'gdpr_default.html'
         }
 
+    def _get_template(self, template_name: str) -> Template:
+        """Return a compiled request template, compiling and keeping it on first use"""
+        template = self._compiled_templates.get(template_name)
+        if template is None:
+            template = self.template_env.get_template(template_name)
+            self._compiled_templates[template_name] = template
+        return template
+
+    async def close(self):
+        """Release pooled HTTP connections held by downstream clients"""
+        await self.blockchain_client.close()
+        await self.event_client.close()
+        await self.email_service.close()
+
     async def generate_gdpr_request(
         self,
         user: User,
@@ -73,7 +112,7 @@ class GDPREngine:
             # Log template selection details for debugging
             logger.info(f"Template selection metadata: {template_metadata}")
 
-            template = self.template_env.get_template(template_name)
+            template = self._get_template(template_name)
         except Exception as e:
             logger.warning(f"Template selection failed: {e}, falling back to legacy logic")
 
@@ -84,11 +123,11 @@ class GDPREngine:
             )
 
             try:
-                template = self.template_env.get_template(template_name)
+                template = self._get_template(template_name)
                 template_metadata = {'fallback': True, 'confidence_score': 0.5}
             except Exception:
                 # Final fallback to default template
-                template = self.template_env.get_template(self.legacy_templates['default'])
+                template = self._get_template(self.legacy_templates['default'])
                 template_metadata = {'fallback': True, 'confidence_score': 0.3}
         
         # Generate unique reference ID
@@ -216,17 +255,21 @@ class GDPREngine:
 
         return gdpr_request
     
-    async def send_gdpr_request(
-        self, 
-        gdpr_request: GDPRRequest,
-        background_tasks=None
-    ):
-        """Send GDPR request via email with tracking"""
+    async def send_gdpr_request(self, gdpr_request: GDPRRequest):
+        """
+        Send GDPR request via email with tracking.
+
+        No in-process follow-up timer is kept: the SENT status and sent_at stored
+        here are the durable schedule. EscalationScheduler rescans them hourly
+        (and the arq worker defers run_followup_check when Redis is configured).
+        """
         
         try:
-            # Get user and creditor data
-            user = await self.db.get_user(gdpr_request.user_id)
-            creditor = await self.db.get_creditor(gdpr_request.creditor_id)
+            # Get user and creditor data (independent lookups, fetched concurrently)
+            user, creditor = await asyncio.gather(
+                self.db.get_user(gdpr_request.user_id),
+                self.db.get_creditor(gdpr_request.creditor_id)
+            )
             
             if not user or not creditor:
                 raise Exception("User or creditor not found")
@@ -251,8 +294,8 @@ class GDPREngine:
             """
             
             # Send email
-            await self.email_service.send_gdpr_request_email(
-                to_email=creditor.privacy_email or f"post@{creditor.name.lower().replace(' ', '')}.no",
+            send_result = await self.email_service.send_gdpr_request_email(
+                to_email=creditor.privacy_email or creditor.fallback_privacy_email,
                 from_email=user.email,
                 from_name=user.name or "DAMOCLES Bruker",
                 subject=subject,
@@ -260,6 +303,10 @@ class GDPREngine:
                 cc_emails=['post@datatilsynet.no'],  # CC data protection authority
                 tracking_id=gdpr_request.id
             )
+
+            # The email service reports delivery failures instead of raising
+            if send_result.get("status") == "failed":
+                raise Exception(f"Email delivery failed: {send_result.get('error')}")
             
             # Update request status
             await self.db.update_gdpr_request(gdpr_request.id, {
@@ -275,7 +322,7 @@ class GDPREngine:
                     creditor_id=creditor.id,
                     delivery_method="email",
                     tracking_info={
-                        "recipient_email": creditor.privacy_email or f"post@{creditor.name.lower().replace(' ', '')}.no",
+                        "recipient_email": creditor.privacy_email or creditor.fallback_privacy_email,
                         "cc_emails": ['post@datatilsynet.no'],
                         "tracking_pixel_url": tracking_pixel_url
                     }
@@ -283,14 +330,6 @@ class GDPREngine:
             except Exception as e:
                 logger.warning(f"⚠️ Failed to record request sent event: {str(e)}")
 
-            # Schedule follow-up reminder
-            if background_tasks:
-                background_tasks.add_task(
-                    self._schedule_followup_reminder,
-                    gdpr_request.id,
-                    delay_days=25  # 5 days before deadline
-                )
-
             logger.info(f"Sent GDPR request {gdpr_request.reference_id}")
             
         except Exception as e:
@@ -355,11 +394,11 @@ class GDPREngine:
             # Detect violations using AI
             violations = await self.violation_detector.analyze(extracted_data)
             
-            # Store violations and record events
-            for violation_data in violations:
-                violation_id = str(uuid.uuid4())
-                await self.db.create_violation({
-                    'id': violation_id,
+            # Store violations in one bulk insert
+            detected_at = datetime.now()
+            violation_rows = [
+                {
+                    'id': str(uuid.uuid4()),
                     'gdpr_request_id': request_id,
                     'creditor_id': gdpr_request.creditor_id,
                     'type': violation_data.type,
@@ -369,33 +408,42 @@ class GDPREngine:
                     'legal_reference': violation_data.legal_reference,
                     'estimated_damage': violation_data.estimated_damage,
                     'status': 'PENDING',
-                    'created_at': datetime.now()
-                })
+                    'created_at': detected_at
+                }
+                for violation_data in violations
+            ]
+            await self.db.create_violations_bulk(violation_rows)
 
-                # Record compliance violation event
-                try:
-                    await self.event_client.record_compliance_violation(
-                        case_id=request_id,
-                        user_id=gdpr_request.user_id,
-                        creditor_id=gdpr_request.creditor_id,
-                        violation_type=violation_data.type,
-                        violation_details={
-                            "severity": violation_data.severity,
-                            "confidence": violation_data.confidence,
-                            "evidence": violation_data.evidence,
-                            "legal_reference": violation_data.legal_reference,
-                            "estimated_damage": violation_data.estimated_damage,
-                            "violation_id": violation_id
-                        }
-                    )
-                except Exception as e:
-                    logger.warning(f"⚠️ Failed to record compliance violation event: {str(e)}")
+            # Record compliance violation events concurrently
+            event_results = await asyncio.gather(*(
+                self.event_client.record_compliance_violation(
+                    case_id=request_id,
+                    user_id=gdpr_request.user_id,
+                    creditor_id=gdpr_request.creditor_id,
+                    violation_type=row['type'],
+                    violation_details={
+                        "severity": row['severity'],
+                        "confidence": row['confidence'],
+                        "evidence": row['evidence'],
+                        "legal_reference": row['legal_reference'],
+                        "estimated_damage": row['estimated_damage'],
+                        "violation_id": row['id']
+                    }
+                )
+                for row in violation_rows
+            ), return_exceptions=True)
+            for result in event_results:
+                if isinstance(result, Exception):
+                    logger.warning(f"⚠️ Failed to record compliance violation event: {str(result)}")
             
             # Update request status
             await self.db.update_gdpr_request(request_id, {
                 'status': 'RESPONDED',
                 'response_received_at': datetime.now()
             })
+
+            # New violations and the status change affect the creditor's public grade
+            self.compliance_snapshots.schedule_refresh(gdpr_request.creditor_id)
             
             # If critical violations found, trigger sword mechanism
             critical_violations = [v for v in violations if v.severity == 'critical']
@@ -439,7 +487,8 @@ class GDPREngine:
                 affected_users = await self.db.get_users_with_creditor_debts(creditor_id)
                 
                 for user in affected_users:
-                    await self.email_service.send_sword_notification(
+                    await self.email_service.buffered.submit(
+                        self.email_service.send_sword_notification,
                         user.email,
                         creditor_id,
                         stats['total_violations']
@@ -459,10 +508,17 @@ class GDPREngine:
     def _generate_reference_id(self, user: User, creditor: Creditor) -> str:
         """Generate unique reference ID for GDPR request"""
         timestamp = datetime.now().strftime('%Y%m%d%H%M')
-        user_hash = str(hash(user.id))[-4:]  # Last 4 digits of user hash
-        creditor_hash = str(hash(creditor.id))[-4:]  # Last 4 digits of creditor hash
-        
-        return f"GDPR-{timestamp}-{user_hash}-{creditor_hash}"
+
+        creditor_tag = self._creditor_tags.get(creditor.id)
+        if creditor_tag is None:
+            digest = hashlib.blake2b(str(creditor.id).encode(), digest_size=3).digest()
+            creditor_tag = self._creditor_tags[creditor.id] = base64.b32encode(digest).decode()[:4]
+
+        # 32 random bits per request: reference_id is unique across every API/worker process,
+        # so the suffix must not depend on a per-process counter or the wall clock
+        suffix = secrets.token_hex(4)
+
+        return f"GDPR-{timestamp}-{creditor_tag}-{suffix}"
     
     def _generate_tracking_pixel_url(self, request_id: str) -> str:
         """Generate tracking pixel URL"""
@@ -482,10 +538,8 @@ class GDPREngine:
         
         return {'account_number': 'Ukjent'}
     
-    async def _schedule_followup_reminder(self, request_id: str, delay_days: int):
-        """Schedule escalating follow-up sequence for GDPR request"""
-        await asyncio.sleep(delay_days * 24 * 60 * 60)
-
+    async def run_followup_check(self, request_id: str):
+        """Escalate a GDPR request that is still awaiting a response"""
         gdpr_request = await self.db.get_gdpr_request(request_id)
 
         if gdpr_request and gdpr_request.status == 'SENT':
@@ -498,8 +552,10 @@ class GDPREngine:
         if not gdpr_request:
             return
 
-        user = await self.db.get_user(gdpr_request.user_id)
-        creditor = await self.db.get_creditor(gdpr_request.creditor_id)
+        user, creditor = await asyncio.gather(
+            self.db.get_user(gdpr_request.user_id),
+            self.db.get_creditor(gdpr_request.creditor_id)
+        )
 
         # Track escalation level to prevent duplicate escalations
         # Check if this escalation level has already been sent
@@ -520,13 +576,14 @@ class GDPREngine:
         if days_elapsed >= 25 and days_elapsed < 35:
             # Days 25-34: Friendly reminder
             logger.info(f"📧 Sending friendly reminder for request {request_id} (Day {days_elapsed})")
-            await self.email_service.send_gdpr_reminder_email(
+            await self.email_service.buffered.submit(
+                self.email_service.send_gdpr_reminder_email,
                 user.email,
                 creditor.name,
                 gdpr_request.reference_id,
                 gdpr_request.response_due
             )
-            logger.info(f"✅ Sent friendly reminder for request {request_id}")
+            logger.info(f"✅ Queued friendly reminder for request {request_id}")
 
         elif days_elapsed >= 35 and days_elapsed < 45:
             # Days 35-44: Formal notice to creditor and Datatilsynet
@@ -668,21 +725,24 @@ class GDPREngine:
             from pdf2image import convert_from_bytes
             import io
 
-            # First attempt: Direct text extraction
+            # First attempt: Direct text and table extraction, one pass per page
             with pdfplumber.open(io.BytesIO(content)) as pdf:
-                extracted_text = ""
+                text_parts = []
+                tables = []
                 for page in pdf.pages:
                     page_text = page.extract_text()
                     if page_text:
-                        extracted_text += page_text + "\n"
+                        text_parts.append(page_text + "\n")
 
-                # Extract tables separately
-                tables = []
-                for page in pdf.pages:
                     page_tables = page.extract_tables()
                     if page_tables:
                         tables.extend(page_tables)
 
+                    # Drop the parsed layout objects before moving on to the next page
+                    page.flush_cache()
+
+                extracted_text = "".join(text_parts)
+
             # Fallback: OCR for scanned PDFs
             if len(extracted_text.strip()) < 50:  # Likely scanned PDF
                 logger.info("Low text extraction, attempting OCR")
@@ -717,8 +777,8 @@ class GDPREngine:
     
     async def _parse_json_response(self, content: bytes) -> Dict[str, Any]:
         """Parse JSON GDPR response"""
-        import json
-        return json.loads(content.decode('utf-8'))
+        # orjson parses the UTF-8 bytes directly, without a decoded str copy of the payload
+        return orjson.loads(content)
     
     async def _parse_text_response(self, content: bytes) -> Dict[str, Any]:
         """Parse plain text GDPR response"""
@@ -755,22 +815,37 @@ class GDPREngine:
         # This would call the settlement service
         settlement_service_url = "http://settlement-service:8003"
         
-        async with aiohttp.ClientSession() as session:
-            for user in affected_users:
-                try:
-                    async with session.post(
-                        f"{settlement_service_url}/settlements/auto-negotiate",
-                        json={
-                            'user_id': user.id,
-                            'creditor_id': creditor_id,
-                            'trigger': 'sword_protocol'
-                        }
-                    ) as response:
-                        if response.status == 200:
-                            logger.info(f"Triggered settlement for user {user.id}")
-                        
-                except Exception as e:
-                    logger.error(f"Failed to trigger settlement for user {user.id}: {e}")
+        # Per-host cap keeps the fan-out from overwhelming the settlement service
+        async with aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit_per_host=32)
+        ) as session:
+            await asyncio.gather(*(
+                self._post_settlement(session, settlement_service_url, user, creditor_id)
+                for user in affected_users
+            ))
+
+    async def _post_settlement(
+        self,
+        session: aiohttp.ClientSession,
+        settlement_service_url: str,
+        user: User,
+        creditor_id: str
+    ):
+        """Ask the settlement service to auto-negotiate for one user"""
+        try:
+            async with session.post(
+                f"{settlement_service_url}/settlements/auto-negotiate",
+                json={
+                    'user_id': user.id,
+                    'creditor_id': creditor_id,
+                    'trigger': 'sword_protocol'
+                }
+            ) as response:
+                if response.status == 200:
+                    logger.info(f"Triggered settlement for user {user.id}")
+
+        except Exception as e:
+            logger.error(f"Failed to trigger settlement for user {user.id}: {e}")
 
     async def _should_trigger_sword_protocol(
         self,
@@ -5,7 +5,7 @@ Mints immutable NFT evidence of GDPR violations on Cardano blockchain
 Sacred Architecture: Blockchain anchoring creates tamper-proof evidence for legal proceedings
 """
 
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple
 from datetime import datetime
 import logging
 import os
@@ -36,6 +36,10 @@ class SWORDService:
         # IPFS configuration for evidence storage (optional)
         self.ipfs_gateway = os.getenv("IPFS_GATEWAY", "https://ipfs.io/ipfs/")
 
+    async def close(self):
+        """Release the pooled Blockfrost connections"""
+        await self.cardano_client.close()
+
     async def mint_violation_evidence(
         self,
         violation: Dict[str, Any],
@@ -73,18 +77,11 @@ class SWORDService:
             }
 
         try:
-            # Generate unique asset name
-            asset_name = self._generate_asset_name(violation, creditor_data)
-
-            # Compute evidence hash
-            evidence_hash = CardanoClient.compute_evidence_hash(evidence_package)
-
-            # Build NFT metadata (CIP-25 compliant)
-            metadata = self._build_sword_metadata(
+            asset_name, evidence_hash, metadata = self._prepare_sword_mint(
                 violation=violation,
                 creditor_data=creditor_data,
                 gdpr_request=gdpr_request,
-                evidence_hash=evidence_hash
+                evidence_package=evidence_package
             )
 
             # Mint NFT on Cardano
@@ -93,26 +90,14 @@ class SWORDService:
                 metadata=metadata
             )
 
-            # Create SWORD token record
-            sword_token = {
-                "asset_id": mint_result.get("asset_id"),
-                "asset_name": asset_name,
-                "token_type": "SWORD",
-                "violation_id": violation.get("id"),
-                "creditor_id": creditor_data.get("id"),
-                "creditor_name": creditor_data.get("name"),
-                "violation_type": violation.get("type"),
-                "severity": violation_severity,
-                "evidence_hash": evidence_hash,
-                "blockchain_tx": mint_result.get("tx_hash"),
-                "explorer_url": mint_result.get("explorer_url"),
-                "network": mint_result.get("network"),
-                "minted_at": datetime.now().isoformat(),
-                "metadata": metadata,
-                "evidence_package": evidence_package,
-                "legal_status": "evidence_anchored",
-                "immutable": True
-            }
+            sword_token = self._build_sword_token(
+                violation=violation,
+                creditor_data=creditor_data,
+                evidence_package=evidence_package,
+                evidence_hash=evidence_hash,
+                metadata=metadata,
+                mint_result=mint_result
+            )
 
             logger.info(f"⚔️  SWORD token minted: {asset_name}")
             logger.info(f"   Creditor: {creditor_data.get('name')}")
@@ -139,7 +124,9 @@ class SWORDService:
         """
         Mint SWORD tokens for multiple violations in batch.
 
-        Used when triggering SWORD protocol for systematic violators.
+        Used when triggering SWORD protocol for systematic violators. Eligible
+        violations are minted together via CardanoClient.mint_nfts_batch, so
+        many tokens share each Cardano transaction.
 
         Returns:
             Summary of minted tokens
@@ -147,8 +134,18 @@ class SWORDService:
 
         minted_tokens = []
         skipped = []
+        pending = []
+        pending_names = set()
 
         for violation in violations:
+            violation_severity = violation.get("severity", "low")
+            if not self._should_mint(violation_severity):
+                skipped.append({
+                    "violation_id": violation.get("id"),
+                    "reason": f"Severity below threshold (minimum: {self.min_severity_for_minting})"
+                })
+                continue
+
             try:
                 # Create evidence package for this violation
                 evidence_package = self._build_evidence_package(
@@ -157,29 +154,49 @@ class SWORDService:
                     gdpr_request=gdpr_request
                 )
 
-                # Mint SWORD token
-                result = await self.mint_violation_evidence(
+                asset_name, evidence_hash, metadata = self._prepare_sword_mint(
                     violation=violation,
                     creditor_data=creditor_data,
                     gdpr_request=gdpr_request or {},
                     evidence_package=evidence_package
                 )
 
-                if result.get("minted"):
-                    minted_tokens.append(result["sword_token"])
-                else:
-                    skipped.append({
-                        "violation_id": violation.get("id"),
-                        "reason": result.get("reason")
-                    })
+                if asset_name in pending_names:
+                    raise ValueError(f"Duplicate SWORD asset name {asset_name}")
+
+                pending_names.add(asset_name)
+                pending.append((violation, evidence_package, evidence_hash, asset_name, metadata))
 
             except Exception as e:
-                logger.error(f"Error minting SWORD token for violation {violation.get('id')}: {e}")
+                logger.error(f"Error preparing SWORD token for violation {violation.get('id')}: {e}")
                 skipped.append({
                     "violation_id": violation.get("id"),
                     "error": str(e)
                 })
 
+        try:
+            mint_results = await self.cardano_client.mint_nfts_batch([
+                (asset_name, metadata)
+                for _, _, _, asset_name, metadata in pending
+            ])
+
+            for (violation, evidence_package, evidence_hash, _, metadata), mint_result in zip(pending, mint_results):
+                minted_tokens.append(self._build_sword_token(
+                    violation=violation,
+                    creditor_data=creditor_data,
+                    evidence_package=evidence_package,
+                    evidence_hash=evidence_hash,
+                    metadata=metadata,
+                    mint_result=mint_result
+                ))
+
+        except Exception as e:
+            logger.error(f"Error batch minting SWORD tokens: {e}")
+            skipped.extend(
+                {"violation_id": violation.get("id"), "error": str(e)}
+                for violation, *_ in pending
+            )
+
         logger.info(f"⚔️  SWORD batch minting complete")
         logger.info(f"   Minted: {len(minted_tokens)} tokens")
         logger.info(f"   Skipped: {len(skipped)}")
@@ -283,6 +300,62 @@ class SWORDService:
             "retrieved_at": datetime.now().isoformat()
         }
 
+    def _prepare_sword_mint(
+        self,
+        violation: Dict[str, Any],
+        creditor_data: Dict[str, Any],
+        gdpr_request: Dict[str, Any],
+        evidence_package: Dict[str, Any]
+    ) -> Tuple[str, str, Dict[str, Any]]:
+        """Build the asset name, evidence hash and CIP-25 metadata for a SWORD token"""
+
+        # Generate unique asset name
+        asset_name = self._generate_asset_name(violation, creditor_data)
+
+        # Compute evidence hash
+        evidence_hash = CardanoClient.compute_evidence_hash(evidence_package)
+
+        # Build NFT metadata (CIP-25 compliant)
+        metadata = self._build_sword_metadata(
+            violation=violation,
+            creditor_data=creditor_data,
+            gdpr_request=gdpr_request,
+            evidence_hash=evidence_hash
+        )
+
+        return asset_name, evidence_hash, metadata
+
+    def _build_sword_token(
+        self,
+        violation: Dict[str, Any],
+        creditor_data: Dict[str, Any],
+        evidence_package: Dict[str, Any],
+        evidence_hash: str,
+        metadata: Dict[str, Any],
+        mint_result: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Create the SWORD token record from a mint result"""
+
+        return {
+            "asset_id": mint_result.get("asset_id"),
+            "asset_name": mint_result.get("asset_name"),
+            "token_type": "SWORD",
+            "violation_id": violation.get("id"),
+            "creditor_id": creditor_data.get("id"),
+            "creditor_name": creditor_data.get("name"),
+            "violation_type": violation.get("type"),
+            "severity": violation.get("severity", "low"),
+            "evidence_hash": evidence_hash,
+            "blockchain_tx": mint_result.get("tx_hash"),
+            "explorer_url": mint_result.get("explorer_url"),
+            "network": mint_result.get("network"),
+            "minted_at": datetime.now().isoformat(),
+            "metadata": metadata,
+            "evidence_package": evidence_package,
+            "legal_status": "evidence_anchored",
+            "immutable": True
+        }
+
     def _should_mint(self, severity: str) -> bool:
         """Check if violation severity meets minting threshold"""
 
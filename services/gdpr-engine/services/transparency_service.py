@@ -6,7 +6,7 @@ Sacred Architecture Principle: Sunlight is the best disinfectant.
 Public accountability creates market pressure for compliance.
 """
 
-from typing import Dict, List, Any
+from typing import AsyncIterator, Dict, List, Any, Tuple
 from datetime import datetime, timedelta
 import logging
 
@@ -116,6 +116,27 @@ class TransparencyService:
 
         return report
 
+    def compute_grade_only(
+        self,
+        violations: List[Dict[str, Any]],
+        gdpr_requests: List[Dict[str, Any]],
+        datatilsynet_complaints: List[Dict[str, Any]],
+        settlements: List[Dict[str, Any]]
+    ) -> Dict[str, Any]:
+        """
+        Calculate only the compliance grade for a creditor.
+
+        Skips public summary, reputation score and report assembly for callers
+        that just need the current grade.
+        """
+
+        return self._calculate_compliance_grade(
+            self._calculate_violation_metrics(violations),
+            self._calculate_response_metrics(gdpr_requests),
+            self._calculate_settlement_metrics(settlements),
+            self._calculate_complaint_metrics(datatilsynet_complaints)
+        )
+
     def _calculate_violation_metrics(self, violations: List[Dict[str, Any]]) -> Dict[str, Any]:
         """Calculate violation statistics"""
 
@@ -449,6 +470,63 @@ Svarrate på GDPR-forespørsler: {response_rate}%
         Categories: "all", "best", "worst"
         """
 
+        title, leaderboard = self._rank_creditors(creditor_reports, category)
+
+        return {
+            "title": title,
+            "category": category,
+            "total_creditors": len(creditor_reports),
+            "leaderboard": [
+                self._leaderboard_entry(idx + 1, report)
+                for idx, report in enumerate(leaderboard)
+            ],
+            "generated_at": datetime.now().isoformat()
+        }
+
+    async def stream_leaderboard(
+        self,
+        creditor_reports: List[Dict[str, Any]],
+        category: str = "all"
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Yield leaderboard entries one at a time, then a closing summary.
+
+        Lets callers flush each ranked creditor as soon as it is built instead of
+        assembling the whole leaderboard document first.
+        """
+
+        title, leaderboard = self._rank_creditors(creditor_reports, category)
+
+        grade_distribution = {"A": 0, "B": 0, "C": 0, "D": 0, "F": 0}
+        total_score = 0
+
+        for idx, report in enumerate(leaderboard):
+            entry = self._leaderboard_entry(idx + 1, report)
+
+            grade_distribution[entry["grade"]] = grade_distribution.get(entry["grade"], 0) + 1
+            total_score += entry["reputation_score"]
+
+            yield entry
+
+        yield {
+            "leaderboard_summary": {
+                "title": title,
+                "category": category,
+                "total_creditors": len(creditor_reports),
+                "ranked_creditors": len(leaderboard),
+                "avg_reputation_score": round(total_score / len(leaderboard), 1) if leaderboard else 0,
+                "grade_distribution": grade_distribution,
+                "generated_at": datetime.now().isoformat()
+            }
+        }
+
+    def _rank_creditors(
+        self,
+        creditor_reports: List[Dict[str, Any]],
+        category: str
+    ) -> Tuple[str, List[Dict[str, Any]]]:
+        """Sort reports by reputation and select the slice for a leaderboard category"""
+
         # Sort by reputation score
         sorted_creditors = sorted(
             creditor_reports,
@@ -471,23 +549,19 @@ Svarrate på GDPR-forespørsler: {response_rate}%
             leaderboard = sorted_creditors
             title = "KREDITOR ETTERLEVELSE - Rangering"
 
+        return title, leaderboard
+
+    def _leaderboard_entry(self, rank: int, report: Dict[str, Any]) -> Dict[str, Any]:
+        """Public leaderboard row for one creditor report"""
+
         return {
-            "title": title,
-            "category": category,
-            "total_creditors": len(creditor_reports),
-            "leaderboard": [
-                {
-                    "rank": idx + 1,
-                    "creditor_name": report["creditor"]["name"],
-                    "org_number": report["creditor"]["org_number"],
-                    "grade": report["compliance_grade"]["grade"],
-                    "reputation_score": report["reputation_score"],
-                    "total_violations": report["metrics"]["violations"]["total_violations"],
-                    "datatilsynet_complaints": report["metrics"]["datatilsynet_complaints"]["total_complaints"]
-                }
-                for idx, report in enumerate(leaderboard)
-            ],
-            "generated_at": datetime.now().isoformat()
+            "rank": rank,
+            "creditor_name": report["creditor"]["name"],
+            "org_number": report["creditor"]["org_number"],
+            "grade": report["compliance_grade"]["grade"],
+            "reputation_score": report["reputation_score"],
+            "total_violations": report["metrics"]["violations"]["total_violations"],
+            "datatilsynet_complaints": report["metrics"]["datatilsynet_complaints"]["total_complaints"]
         }
 
     async def generate_industry_report(
@@ -501,10 +575,25 @@ Svarrate på GDPR-forespørsler: {response_rate}%
         Shows aggregate compliance statistics for entire industry.
         """
 
-        # Filter by industry
+        return self.generate_industry_report_sync(creditor_reports, industry)
+
+    def generate_industry_report_sync(
+        self,
+        creditor_reports: List[Dict[str, Any]],
+        industry: str = "INKASSO"
+    ) -> Dict[str, Any]:
+        """
+        Synchronous industry report generation.
+
+        Pure CPU work over plain dicts, so it can run in a process pool
+        (arguments and result are pickle-friendly).
+        """
+
+        # Filter by industry (creditor types are stored lowercase, e.g. 'inkasso')
+        industry_key = industry.upper()
         industry_reports = [
             r for r in creditor_reports
-            if r["creditor"].get("type") == industry
+            if str(r["creditor"].get("type", "")).upper() == industry_key
         ]
 
         if not industry_reports:
@@ -0,0 +1,118 @@
+"""
+In-process TTL Cache
+Caches expensive, read-heavy results (public transparency reports) for a short window
+
+Values are refreshed in the background shortly before they expire so readers
+rarely pay the cold-compute cost.
+"""
+
+import asyncio
+import time
+import logging
+from collections import defaultdict
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class TTLCache:
+    """Async TTL cache with per-key locking and refresh-ahead"""
+
+    def __init__(
+        self,
+        ttl_seconds: float,
+        refresh_ahead_seconds: float = 0.0,
+        max_entries: Optional[int] = None
+    ):
+        self.ttl_seconds = ttl_seconds
+        self.refresh_ahead_seconds = refresh_ahead_seconds
+        self.max_entries = max_entries
+
+        # key -> (expires_at monotonic seconds, value)
+        self._entries: Dict[Hashable, Tuple[float, Any]] = {}
+        self._locks: Dict[Hashable, asyncio.Lock] = defaultdict(asyncio.Lock)
+        self._refresh_tasks: Set[asyncio.Task] = set()
+
+    async def get_or_compute(
+        self,
+        key: Hashable,
+        compute: Callable[[], Awaitable[Any]]
+    ) -> Any:
+        """Return the cached value for key, computing it once if missing or expired"""
+
+        value = self._get_fresh(key, compute)
+        if value is not None:
+            return value
+
+        # Only one coroutine computes a given key; the rest wait and reuse it
+        async with self._locks[key]:
+            entry = self._entries.get(key)
+            if entry and time.monotonic() < entry[0]:
+                return entry[1]
+
+            value = await compute()
+            self._entries[key] = (time.monotonic() + self.ttl_seconds, value)
+            self._evict()
+            return value
+
+    def invalidate(self, key: Optional[Hashable] = None):
+        """Drop one cached key, or everything when key is None"""
+        keys = list(self._locks) if key is None else [key]
+
+        if key is None:
+            self._entries.clear()
+        else:
+            self._entries.pop(key, None)
+
+        # Drop idle locks too; a held lock stays so its waiters keep single-flight
+        for cleared in keys:
+            lock = self._locks.get(cleared)
+            if lock is not None and not lock.locked():
+                del self._locks[cleared]
+
+    def _evict(self):
+        """Keep the cache within max_entries, dropping expired then soonest-expiring keys"""
+        if self.max_entries is None or len(self._entries) <= self.max_entries:
+            return
+
+        now = time.monotonic()
+        for key in [k for k, (expires_at, _) in self._entries.items() if expires_at <= now]:
+            self._entries.pop(key, None)
+            self._locks.pop(key, None)
+
+        overflow = len(self._entries) - self.max_entries
+        if overflow > 0:
+            for key in sorted(self._entries, key=lambda k: self._entries[k][0])[:overflow]:
+                self._entries.pop(key, None)
+                self._locks.pop(key, None)
+
+    def _get_fresh(self, key: Hashable, compute: Callable[[], Awaitable[Any]]) -> Any:
+        entry = self._entries.get(key)
+        if not entry:
+            return None
+
+        expires_at, value = entry
+        remaining = expires_at - time.monotonic()
+        if remaining <= 0:
+            return None
+
+        if remaining < self.refresh_ahead_seconds and not self._locks[key].locked():
+            task = asyncio.create_task(self._refresh(key, compute))
+            self._refresh_tasks.add(task)
+            task.add_done_callback(self._refresh_tasks.discard)
+
+        return value
+
+    async def _refresh(self, key: Hashable, compute: Callable[[], Awaitable[Any]]):
+        async with self._locks[key]:
+            entry = self._entries.get(key)
+            if entry and entry[0] - time.monotonic() >= self.refresh_ahead_seconds:
+                return  # Another refresh already landed
+
+            try:
+                value = await compute()
+            except Exception as e:
+                logger.warning(f"Background cache refresh failed for {key}: {e}")
+                return
+
+            self._entries[key] = (time.monotonic() + self.ttl_seconds, value)
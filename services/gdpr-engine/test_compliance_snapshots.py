@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+"""
+Compliance Snapshot Service Tests
+
+Covers the live rebuild path (concurrent rebuilds of the same scope share
+one leaderboard dataset fetch, and a failed rebuild reaches every waiter),
+serving stored snapshots only when they cover every active creditor, and the
+write-triggered refresh of a single creditor's snapshot.
+
+Usage:
+    python -m pytest test_compliance_snapshots.py
+"""
+
+import asyncio
+from datetime import datetime, timedelta
+
+import pytest
+
+pytest.importorskip("asyncpg")
+pytest.importorskip("pydantic")
+
+from models.creditor import Creditor
+from services.compliance_snapshot_service import ComplianceSnapshotService
+
+
+class FakeDatabase:
+    """Leaderboard dataset source that blocks until released"""
+
+    def __init__(self, error: Exception = None):
+        self.error = error
+        self.dataset_calls = []
+        self.release = asyncio.Event()
+        self.snapshots = {}
+        self.snapshot_time = datetime.now()
+        self.creditor_ids = {"creditor-1"}
+
+    async def get_leaderboard_dataset(self, industry=None):
+        self.dataset_calls.append(industry)
+        await self.release.wait()
+        if self.error:
+            raise self.error
+        return [
+            {
+                "creditor": {"id": "creditor-1", "name": "Test Inkasso AS", "type": "INKASSO"},
+                "violations": [],
+                "gdpr_requests": [],
+                "datatilsynet_complaints": [],
+                "settlements": []
+            }
+        ]
+
+    async def upsert_compliance_snapshot(self, creditor_id, creditor_type, report):
+        self.snapshots[creditor_id] = report
+
+    async def get_compliance_snapshots(self, industry=None):
+        return [
+            {"creditor_id": creditor_id, "report_json": report, "updated_at": self.snapshot_time}
+            for creditor_id, report in self.snapshots.items()
+        ]
+
+    async def get_active_creditor_ids(self, industry=None):
+        return self.creditor_ids
+
+    async def get_creditor(self, creditor_id):
+        # Same shape as Database.get_creditor: a Creditor model, not a dict
+        return Creditor(
+            id=creditor_id,
+            name="Test Inkasso AS",
+            organization_number="987654321",
+            type="inkasso",
+            created_at=datetime(2025, 1, 1),
+            updated_at=datetime(2025, 1, 1)
+        )
+
+    async def get_creditor_violations(self, creditor_id):
+        return [{"id": "violation-1", "creditor_id": creditor_id, "severity": "high"}]
+
+    async def get_creditor_gdpr_requests(self, creditor_id):
+        return []
+
+    async def get_creditor_datatilsynet_complaints(self, creditor_id):
+        return []
+
+    async def get_creditor_settlements(self, creditor_id):
+        return []
+
+
+class FakeTransparencyService:
+    async def generate_creditor_report(self, creditor_data, **related):
+        return {"creditor": creditor_data, "violation_count": len(related["violations"])}
+
+
+def test_concurrent_rebuilds_share_one_dataset_fetch():
+    async def scenario():
+        db = FakeDatabase()
+        service = ComplianceSnapshotService(db, FakeTransparencyService())
+
+        rebuilds = [asyncio.create_task(service._rebuild("INKASSO")) for _ in range(5)]
+        other_scope = asyncio.create_task(service._rebuild(None))
+        await asyncio.sleep(0)
+
+        db.release.set()
+        results = await asyncio.gather(*rebuilds)
+        await other_scope
+
+        # One fetch per scope, every waiter gets the same reports
+        assert sorted(db.dataset_calls, key=str) == ["INKASSO", None]
+        assert all(result == results[0] for result in results)
+        assert results[0][0]["creditor"]["name"] == "Test Inkasso AS"
+        assert "creditor-1" in db.snapshots
+
+        # Nothing left in flight, so the next rebuild fetches again
+        assert not service._inflight
+        await service._rebuild("INKASSO")
+        assert db.dataset_calls.count("INKASSO") == 2
+
+    asyncio.run(scenario())
+
+
+def test_failed_rebuild_propagates_to_all_waiters():
+    async def scenario():
+        db = FakeDatabase(error=RuntimeError("user-service unavailable"))
+        service = ComplianceSnapshotService(db, FakeTransparencyService())
+
+        rebuilds = [asyncio.create_task(service._rebuild("INKASSO")) for _ in range(3)]
+        await asyncio.sleep(0)
+        db.release.set()
+
+        results = await asyncio.gather(*rebuilds, return_exceptions=True)
+
+        assert db.dataset_calls == ["INKASSO"]
+        assert all(isinstance(result, RuntimeError) for result in results)
+        assert not service._inflight
+
+    asyncio.run(scenario())
+
+
+def test_snapshots_served_only_when_they_cover_every_creditor():
+    async def scenario():
+        db = FakeDatabase()
+        db.release.set()
+        db.creditor_ids = {"creditor-1", "creditor-2"}
+        db.snapshots = {"creditor-2": {"creditor": {"name": "Stored"}}}
+        service = ComplianceSnapshotService(db, FakeTransparencyService())
+
+        # creditor-1 has no snapshot yet: rebuild from live data
+        await service.get_creditor_reports()
+        assert db.dataset_calls == [None]
+
+        # Full, fresh coverage: served from snapshots without a rebuild
+        db.creditor_ids = {"creditor-1"}
+        reports = await service.get_creditor_reports()
+        assert db.dataset_calls == [None]
+        assert reports == [db.snapshots["creditor-1"]]
+
+        # Stale rows are rebuilt
+        db.snapshot_time = datetime.now() - timedelta(hours=1)
+        await service.get_creditor_reports()
+        assert db.dataset_calls == [None, None]
+
+    asyncio.run(scenario())
+
+
+def test_refresh_stores_snapshot_for_creditor_model():
+    async def scenario():
+        db = FakeDatabase()
+        refreshed = []
+        service = ComplianceSnapshotService(
+            db,
+            FakeTransparencyService(),
+            on_refresh=lambda: refreshed.append(True)
+        )
+
+        await service.refresh("creditor-1")
+
+        assert db.snapshots["creditor-1"] == {
+            "creditor": {"name": "Test Inkasso AS", "org_number": "987654321", "type": "inkasso"},
+            "violation_count": 1
+        }
+        assert refreshed == [True]
+
+    asyncio.run(scenario())
@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""
+TTL Cache Tests
+
+Covers the transparency/report cache: single-flight computes, expiry,
+refresh-ahead and max_entries eviction. Time is driven by a fake monotonic
+clock so nothing sleeps.
+
+Usage:
+    python -m pytest test_ttl_cache.py
+"""
+
+import asyncio
+
+import pytest
+
+from services import ttl_cache
+from services.ttl_cache import TTLCache
+
+
+class FakeClock:
+    """Stands in for the time module inside services.ttl_cache"""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def monotonic(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(ttl_cache, "time", fake)
+    return fake
+
+
+def counting_compute(calls, value="v"):
+    async def compute():
+        calls.append(value)
+        await asyncio.sleep(0)
+        return f"{value}{len(calls)}"
+    return compute
+
+
+def test_concurrent_get_or_compute_computes_once(clock):
+    async def scenario():
+        cache = TTLCache(ttl_seconds=60)
+        calls = []
+        compute = counting_compute(calls)
+
+        results = await asyncio.gather(*(cache.get_or_compute("key", compute) for _ in range(20)))
+
+        assert calls == ["v"]
+        assert set(results) == {"v1"}
+
+    asyncio.run(scenario())
+
+
+def test_expired_entry_is_recomputed(clock):
+    async def scenario():
+        cache = TTLCache(ttl_seconds=60)
+        calls = []
+        compute = counting_compute(calls)
+
+        assert await cache.get_or_compute("key", compute) == "v1"
+
+        clock.now += 59
+        assert await cache.get_or_compute("key", compute) == "v1"
+
+        clock.now += 1
+        assert await cache.get_or_compute("key", compute) == "v2"
+        assert len(calls) == 2
+
+    asyncio.run(scenario())
+
+
+def test_refresh_ahead_serves_stale_value_and_refreshes_in_background(clock):
+    async def scenario():
+        cache = TTLCache(ttl_seconds=60, refresh_ahead_seconds=10)
+        calls = []
+        compute = counting_compute(calls)
+
+        assert await cache.get_or_compute("key", compute) == "v1"
+
+        # Outside the refresh-ahead window: no background work
+        clock.now += 49
+        assert await cache.get_or_compute("key", compute) == "v1"
+        assert not cache._refresh_tasks
+
+        # Inside the window: current value returned, one refresh scheduled
+        clock.now += 2
+        assert await cache.get_or_compute("key", compute) == "v1"
+        assert len(cache._refresh_tasks) == 1
+        await asyncio.gather(*cache._refresh_tasks)
+
+        assert len(calls) == 2
+        assert await cache.get_or_compute("key", compute) == "v2"
+
+        # The refreshed entry got a full TTL from the refresh time
+        clock.now += 49
+        assert await cache.get_or_compute("key", compute) == "v2"
+        assert len(calls) == 2
+
+    asyncio.run(scenario())
+
+
+def test_max_entries_evicts_expired_then_soonest_expiring(clock):
+    async def scenario():
+        cache = TTLCache(ttl_seconds=60, max_entries=2)
+        calls = []
+
+        await cache.get_or_compute("a", counting_compute(calls, "a"))
+        clock.now += 1
+        await cache.get_or_compute("b", counting_compute(calls, "b"))
+        clock.now += 1
+        await cache.get_or_compute("c", counting_compute(calls, "c"))
+
+        # "a" expires first, so it is the one dropped
+        assert set(cache._entries) == {"b", "c"}
+        assert "a" not in cache._locks
+
+        # Once "b" has expired it goes before the newer, still-valid "c"
+        clock.now += 59
+        await cache.get_or_compute("d", counting_compute(calls, "d"))
+        assert set(cache._entries) == {"c", "d"}
+
+    asyncio.run(scenario())
+
+
+def test_invalidate_drops_entries_and_idle_locks(clock):
+    async def scenario():
+        cache = TTLCache(ttl_seconds=60)
+        calls = []
+
+        await cache.get_or_compute("a", counting_compute(calls, "a"))
+        await cache.get_or_compute("b", counting_compute(calls, "b"))
+
+        cache.invalidate("a")
+        assert set(cache._entries) == {"b"}
+        assert set(cache._locks) == {"b"}
+
+        cache.invalidate()
+        assert not cache._entries
+        assert not cache._locks
+
+    asyncio.run(scenario())
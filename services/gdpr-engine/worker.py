@@ -0,0 +1,98 @@
+"""
+GDPR Engine Background Worker
+Runs slow GDPR jobs outside the API process via an arq (Redis) queue
+
+Jobs:
+- send_gdpr_request: SendGrid delivery + status update
+- process_gdpr_response: response parsing + violation detection
+- trigger_sword_protocol: SWORD protocol for systematic violators
+- run_followup_check: Day 25 follow-up for unanswered requests
+
+Usage:
+    arq worker.WorkerSettings
+"""
+
+import os
+import sys
+import logging
+from datetime import timedelta
+from typing import Any, Dict
+
+from arq.connections import RedisSettings
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from database import Database
+from services.gdpr_engine import GDPREngine
+
+logger = logging.getLogger(__name__)
+
+# Follow-up check runs 5 days before the 30-day GDPR deadline
+FOLLOWUP_DELAY = timedelta(days=25)
+
+
+async def startup(ctx: Dict[str, Any]):
+    db = Database()
+    await db.connect()
+    ctx['db'] = db
+    ctx['gdpr_engine'] = GDPREngine(db)
+    logger.info("GDPR worker started successfully")
+
+
+async def shutdown(ctx: Dict[str, Any]):
+    await ctx['gdpr_engine'].close()
+    await ctx['db'].disconnect()
+    logger.info("GDPR worker shutdown completed")
+
+
+async def send_gdpr_request(ctx: Dict[str, Any], request_id: str):
+    """Send a GDPR request and schedule its follow-up check"""
+    gdpr_request = await ctx['db'].get_gdpr_request(request_id)
+    if not gdpr_request:
+        logger.warning(f"GDPR request {request_id} not found, skipping send")
+        return
+
+    await ctx['gdpr_engine'].send_gdpr_request(gdpr_request)
+
+    await ctx['redis'].enqueue_job(
+        'run_followup_check',
+        request_id,
+        _defer_by=FOLLOWUP_DELAY
+    )
+
+
+async def process_gdpr_response(
+    ctx: Dict[str, Any],
+    request_id: str,
+    response_content: bytes,
+    response_format: str
+):
+    """Parse a creditor response and record detected violations"""
+    await ctx['gdpr_engine'].process_gdpr_response(
+        request_id,
+        response_content,
+        response_format
+    )
+
+
+async def trigger_sword_protocol(ctx: Dict[str, Any], creditor_id: str, stats: Dict[str, Any]):
+    """Run the SWORD protocol for a creditor"""
+    await ctx['gdpr_engine'].trigger_sword_protocol(creditor_id, stats)
+
+
+async def run_followup_check(ctx: Dict[str, Any], request_id: str):
+    """Escalate a request that is still unanswered at the follow-up checkpoint"""
+    await ctx['gdpr_engine'].run_followup_check(request_id)
+
+
+class WorkerSettings:
+    functions = [
+        send_gdpr_request,
+        process_gdpr_response,
+        trigger_sword_protocol,
+        run_followup_check
+    ]
+    on_startup = startup
+    on_shutdown = shutdown
+    redis_settings = RedisSettings.from_dsn(os.getenv("REDIS_URL", "redis://localhost:6379"))
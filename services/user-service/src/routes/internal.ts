@@ -55,6 +55,30 @@ export async function internalRoutes(fastify: FastifyInstance) {
     return reply.send({ user });
   });
 
+  // Get IDs of active creditors, optionally one industry (internal service-to-service)
+  // Used by GDPR engine to check that stored compliance snapshots cover every creditor
+  fastify.get('/creditors/ids', async (request: FastifyRequest, reply: FastifyReply) => {
+    const { industry } = request.query as { industry?: string };
+
+    const whereClause: any = {
+      isActive: true
+    };
+
+    if (industry) {
+      whereClause.type = { equals: industry, mode: 'insensitive' };
+    }
+
+    const creditors = await prisma.creditor.findMany({
+      where: whereClause,
+      select: { id: true }
+    });
+
+    return reply.send({
+      ids: creditors.map(creditor => creditor.id),
+      count: creditors.length
+    });
+  });
+
   // Get creditor by ID (internal service-to-service)
   fastify.get('/creditors/:creditorId', async (request: FastifyRequest, reply: FastifyReply) => {
     const { creditorId } = request.params as { creditorId: string };
@@ -239,6 +263,98 @@ export async function internalRoutes(fastify: FastifyInstance) {
     });
   });
 
+  // Record a creditor's GDPR response and mark the request responded (internal service-to-service)
+  // Used by GDPR engine creditor portal; both writes commit in one transaction
+  fastify.post('/gdpr-requests/:requestId/creditor-response', async (request: FastifyRequest, reply: FastifyReply) => {
+    const { requestId } = request.params as { requestId: string };
+    const { creditor_id, response } = request.body as {
+      creditor_id: string;
+      response: Record<string, any>;
+    };
+
+    if (!creditor_id || !response) {
+      return reply.status(400).send({
+        error: 'Missing required fields: creditor_id and response'
+      });
+    }
+
+    const updated = await prisma.$transaction(async (tx) => {
+      const result = await tx.gdprRequest.updateMany({
+        where: { id: requestId, creditorId: creditor_id },
+        data: {
+          status: 'RESPONDED',
+          responseReceivedAt: new Date()
+        }
+      });
+
+      if (result.count === 0) {
+        return false;
+      }
+
+      await tx.gdprResponse.create({
+        data: {
+          requestId: requestId,
+          format: 'json',
+          extractedData: JSON.stringify(response)
+        }
+      });
+
+      return true;
+    });
+
+    if (!updated) {
+      return reply.status(404).send({ error: 'GDPR request not found' });
+    }
+
+    return reply.send({ success: true });
+  });
+
+  // Record a creditor's settlement decision (internal service-to-service)
+  // Used by GDPR engine creditor portal; only the creditor holding the debt can respond
+  fastify.post('/settlements/:settlementId/creditor-response', async (request: FastifyRequest, reply: FastifyReply) => {
+    const { settlementId } = request.params as { settlementId: string };
+    const { creditor_id, action, counter_offer_amount, notes } = request.body as {
+      creditor_id: string;
+      action: string;
+      counter_offer_amount?: number | null;
+      notes?: string | null;
+    };
+
+    if (!creditor_id) {
+      return reply.status(400).send({ error: 'Missing required field: creditor_id' });
+    }
+
+    const statusByAction: Record<string, string> = {
+      accept: 'accepted',
+      reject: 'rejected',
+      counter: 'negotiating'
+    };
+
+    if (!statusByAction[action]) {
+      return reply.status(400).send({ error: 'Invalid action. Must be one of: accept, reject, counter' });
+    }
+
+    if (action === 'counter' && !counter_offer_amount) {
+      return reply.status(400).send({ error: 'Counter-offer requires counter_offer_amount' });
+    }
+
+    const result = await prisma.settlement.updateMany({
+      where: { id: settlementId, debt: { creditorId: creditor_id } },
+      data: {
+        status: statusByAction[action],
+        counterOfferAmount: action === 'counter' ? counter_offer_amount : null,
+        creditorNotes: notes ?? null,
+        creditorRespondedAt: new Date()
+      }
+    });
+
+    if (result.count === 0) {
+      return reply.status(404).send({ error: 'Settlement not found' });
+    }
+
+    return reply.send({ success: true });
+  });
+
   // Get violations for user-creditor pair (internal service-to-service)
   // Used by settlement service to analyze GDPR violations
   fastify.get('/violations/user-creditor', async (request: FastifyRequest, reply: FastifyReply) => {
@@ -341,4 +457,202 @@ export async function internalRoutes(fastify: FastifyInstance) {
       count: transformedRequests.length
     });
   });
+
+  // Get violations for a creditor with optional filters (internal service-to-service)
+  // Used by GDPR engine creditor portal; filtering happens in the query, not the caller
+  fastify.get('/creditors/:creditorId/violations', async (request: FastifyRequest, reply: FastifyReply) => {
+    const { creditorId } = request.params as { creditorId: string };
+    const { severity, type, limit, offset = '0' } = request.query as {
+      severity?: string;
+      type?: string;
+      limit?: string;
+      offset?: string;
+    };
+
+    const whereClause: any = {
+      creditorId: creditorId
+    };
+
+    if (severity) {
+      whereClause.severity = severity;
+    }
+
+    if (type) {
+      whereClause.type = type;
+    }
+
+    const violations = await prisma.violation.findMany({
+      where: whereClause,
+      orderBy: {
+        createdAt: 'desc'
+      },
+      take: limit ? parseInt(limit) : undefined,
+      skip: parseInt(offset),
+      select: {
+        id: true,
+        gdprRequestId: true,
+        creditorId: true,
+        type: true,
+        severity: true,
+        status: true,
+        confidence: true,
+        evidence: true,
+        legalReference: true,
+        estimatedDamage: true,
+        blockchainHash: true,
+        createdAt: true
+      }
+    });
+
+    // Transform to snake_case for Python/Pydantic compatibility
+    const transformedViolations = violations.map(violation => ({
+      id: violation.id,
+      gdpr_request_id: violation.gdprRequestId,
+      creditor_id: violation.creditorId,
+      type: violation.type,
+      severity: violation.severity,
+      status: violation.status,
+      confidence: violation.confidence,
+      evidence: violation.evidence,
+      legal_reference: violation.legalReference,
+      estimated_damage: violation.estimatedDamage,
+      blockchain_hash: violation.blockchainHash,
+      created_at: violation.createdAt
+    }));
+
+    return reply.send({
+      violations: transformedViolations,
+      count: transformedViolations.length
+    });
+  });
+
+  // Bulk transparency dataset (internal service-to-service)
+  // Used by GDPR engine leaderboard/industry reports: one round-trip instead of per-creditor lookups.
+  // Related rows are returned flat and keyed by creditor_id; the caller buckets them.
+  fastify.get('/transparency/dataset', async (request: FastifyRequest, reply: FastifyReply) => {
+    const { industry } = request.query as { industry?: string };
+
+    const creditorWhere: any = {
+      isActive: true
+    };
+
+    if (industry) {
+      creditorWhere.type = { equals: industry, mode: 'insensitive' };
+    }
+
+    const creditors = await prisma.creditor.findMany({
+      where: creditorWhere,
+      select: {
+        id: true,
+        name: true,
+        organizationNumber: true,
+        type: true
+      }
+    });
+
+    const creditorIds = creditors.map(creditor => creditor.id);
+
+    const [violations, gdprRequests, settlements] = await Promise.all([
+      prisma.violation.findMany({
+        where: { creditorId: { in: creditorIds } },
+        orderBy: { createdAt: 'desc' },
+        select: {
+          id: true,
+          gdprRequestId: true,
+          creditorId: true,
+          type: true,
+          severity: true,
+          status: true,
+          confidence: true,
+          evidence: true,
+          legalReference: true,
+          estimatedDamage: true,
+          blockchainHash: true,
+          createdAt: true
+        }
+      }),
+      prisma.gdprRequest.findMany({
+        where: { creditorId: { in: creditorIds } },
+        orderBy: { createdAt: 'desc' },
+        select: {
+          id: true,
+          userId: true,
+          creditorId: true,
+          referenceId: true,
+          status: true,
+          sentAt: true,
+          responseDue: true,
+          responseReceivedAt: true,
+          createdAt: true,
+          updatedAt: true
+        }
+      }),
+      prisma.settlement.findMany({
+        where: { debt: { creditorId: { in: creditorIds } } },
+        orderBy: { proposedAt: 'desc' },
+        select: {
+          id: true,
+          userId: true,
+          debtId: true,
+          originalAmount: true,
+          settledAmount: true,
+          savedAmount: true,
+          status: true,
+          proposedAt: true,
+          completedAt: true,
+          debt: { select: { creditorId: true } }
+        }
+      })
+    ]);
+
+    // Transform to snake_case for Python/Pydantic compatibility
+    return reply.send({
+      creditors: creditors.map(creditor => ({
+        id: creditor.id,
+        name: creditor.name,
+        org_number: creditor.organizationNumber,
+        type: creditor.type
+      })),
+      violations: violations.map(violation => ({
+        id: violation.id,
+        gdpr_request_id: violation.gdprRequestId,
+        creditor_id: violation.creditorId,
+        type: violation.type,
+        severity: violation.severity,
+        status: violation.status,
+        confidence: violation.confidence,
+        evidence: violation.evidence,
+        legal_reference: violation.legalReference,
+        estimated_damage: violation.estimatedDamage,
+        blockchain_hash: violation.blockchainHash,
+        created_at: violation.createdAt
+      })),
+      gdprRequests: gdprRequests.map(req => ({
+        id: req.id,
+        user_id: req.userId,
+        creditor_id: req.creditorId,
+        reference_id: req.referenceId,
+        status: req.status,
+        sent_at: req.sentAt,
+        response_due: req.responseDue,
+        response_received_at: req.responseReceivedAt,
+        created_at: req.createdAt,
+        updated_at: req.updatedAt
+      })),
+      // Datatilsynet complaints are not persisted yet
+      datatilsynetComplaints: [],
+      settlements: settlements.map(settlement => ({
+        id: settlement.id,
+        user_id: settlement.userId,
+        debt_id: settlement.debtId,
+        creditor_id: settlement.debt.creditorId,
+        original_amount: settlement.originalAmount,
+        settled_amount: settlement.settledAmount,
+        saved_amount: settlement.savedAmount,
+        status: settlement.status,
+        proposed_at: settlement.proposedAt,
+        completed_at: settlement.completedAt
+      }))
+    });
+  });
 }